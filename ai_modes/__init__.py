@@ -8,13 +8,41 @@ Factories:
 
 Container code can import these to construct the active strategy
 based on MODE (V5 / AIV6 / AIV7).
+
+Strategy classes (V5Legacy / AIV6Hybrid / AIV7Flagship) are resolved lazily
+on first attribute access (PEP 562), so a process running a single MODE never
+imports the other two strategy modules.
 """
 
 from __future__ import annotations
-from typing import Any, Dict
+import importlib
+from typing import Any, Dict, Tuple
 
 from .contracts import ModeStrategy  # for type hints only
 
+__all__ = ["make_v5", "make_v6", "make_v7", "V5Legacy", "AIV6Hybrid", "AIV7Flagship"]
+
+# name -> (module, attribute) for strategy classes loaded on first access
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "V5Legacy": ("ai_modes.v5_legacy", "V5Legacy"),
+    "AIV6Hybrid": ("ai_modes.v6_hybrid", "AIV6Hybrid"),
+    "AIV7Flagship": ("ai_modes.v7_flagship", "AIV7Flagship"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        mod, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(mod), attr)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 def make_v5() -> ModeStrategy:
     """Pure deterministic mode — no LLM, no tool calls from here."""
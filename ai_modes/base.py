@@ -0,0 +1,104 @@
+"""
+Shared base for the grounded AI modes (AIV6 / AIV7).
+
+Both modes answer by intent, so plan()/rewrite() dispatch through class-level
+tables (intent -> handler) instead of if/elif chains; a subclass only lists
+the handlers it implements and a default for everything else.
+
+Also holds the plumbing both modes had copied: clarifier table + lookup and
+the light CTA suffix.
+
+Stdlib only (same rule as contracts.py).
+"""
+
+from __future__ import annotations
+import functools
+from typing import Any, Callable, ClassVar, Dict, Mapping
+
+from .contracts import EMPTY, ModeStrategy, ctx_intent, safe_minimal_rewrite
+
+
+DEFAULT_CLARIFIERS = {
+    "check_delivery": "What’s your postcode (e.g., E1 6AN)?",
+    "search_product": "Which product or category are you after?",
+    "price_check": "Which SKU should I check the price for?",
+    "faq": "Could you clarify your question?",
+    "unknown": "Could you clarify what you need?",
+}
+
+# CTA appended to grounded replies; skipped when the text already closes the turn
+_CTA_SUFFIX = " Anything else you’d like to check?"
+_CTA_SKIP = ("anything else.", "anything else")
+
+
+class GroundedMode(ModeStrategy):
+    """
+    Table-driven plan/rewrite dispatch.
+
+    Handler signatures (plain functions in the class body, called with self):
+      plan:    (self, user_text, ctx, intent, ent) -> Dict[str, Any]
+      rewrite: (self, draft, ctx, intent, ent, facts) -> str
+    """
+
+    _PLAN_HANDLERS: ClassVar[Dict[str, Callable[..., Dict[str, Any]]]] = {}
+    _REWRITE_HANDLERS: ClassVar[Dict[str, Callable[..., str]]] = {}
+
+    concise: bool = True
+
+    def _init_prompts(self, prompts: Mapping[str, Any] | None) -> None:
+        self.prompts = prompts or {}
+        self.clarifiers = {**DEFAULT_CLARIFIERS, **(self.prompts.get("clarifiers") or {})}
+        self.offers = self.prompts.get("offers") or {}
+        # clarifiers is fixed after construction, so memoize the lookup per instance
+        self._clarifier = functools.lru_cache(maxsize=16)(self._clarifier_impl)
+
+    # -------------------------
+    # Dispatch
+    # -------------------------
+    def plan(self, user_text: str, ctx: Dict[str, Any]) -> Dict[str, Any]:
+        intent = ctx_intent(ctx)
+        handler = self._PLAN_HANDLERS.get(intent, type(self)._plan_default)
+        return handler(self, user_text, ctx, intent, ctx.get("entities") or EMPTY)
+
+    def rewrite(self, draft: str, ctx: Dict[str, Any]) -> str:
+        intent = ctx_intent(ctx) or "unknown"
+        handler = self._REWRITE_HANDLERS.get(intent, type(self)._rewrite_default)
+        return handler(
+            self, draft, ctx, intent, ctx.get("entities") or EMPTY, ctx.get("facts") or EMPTY
+        )
+
+    # Fallbacks for intents without a handler (faq / unknown / anything new)
+    def _plan_default(self, user_text: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any]) -> Dict[str, Any]:
+        return {
+            "goal": f"Answer intent={intent} with grounded facts.",
+            "tools": [],
+            "constraints": {"no_fabrication": True, "concise": self.concise},
+        }
+
+    def _rewrite_default(
+        self, draft: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any], facts: Mapping[str, Any]
+    ) -> str:
+        # ---- FAQ ----
+        if facts.get("faq") and facts["faq"].get("answer"):
+            return self._cta(facts["faq"]["answer"])
+
+        # ---- Unknown → clarifier or minimal draft polish ----
+        if draft and not draft[:20].lower().startswith("could you"):
+            # Draft came from deterministic composer; keep it but ensure tone
+            return self._cta(safe_minimal_rewrite(draft))
+        return self._clarifier(intent)
+
+    # -------------------------
+    # helpers
+    # -------------------------
+    def _clarifier_impl(self, intent: str) -> str:
+        return self.clarifiers.get(intent) or DEFAULT_CLARIFIERS.get(intent) or DEFAULT_CLARIFIERS["unknown"]
+
+    def _cta(self, text: str) -> str:
+        """Adds a light CTA unless the reply already ends the turn."""
+        t = (text or "").strip()
+        if not t or t[-1] == "?":
+            return t
+        if t[-16:].lower().endswith(_CTA_SKIP):
+            return t
+        return t + _CTA_SUFFIX
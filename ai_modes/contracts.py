@@ -8,8 +8,10 @@ Keep this file dependency-light (stdlib only) to avoid circular imports.
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Protocol, TypeAlias
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Protocol, TypeAlias
 
 
 # ---- Public protocol used by services.message_handler ----
@@ -27,7 +29,7 @@ ModeContracts: TypeAlias = ModeStrategy
 
 # ---- Optional richer structures for AIV7 ----
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     """A single tool call the planner wants to execute."""
     name: str                        # e.g., "catalog.search", "geo.nearest"
@@ -35,7 +37,7 @@ class ToolCall:
     required: bool = True            # if True and it fails → fallback/clarify
 
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     """
     High-level plan for producing a reply:
@@ -48,18 +50,20 @@ class Plan:
     constraints: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
+        # .copy() keeps callers from mutating shared constraint/arg dicts
         return {
             "goal": self.goal,
             "tools": [
-                {"name": t.name, "args": dict(t.args), "required": t.required}
+                {"name": t.name, "args": t.args.copy(), "required": t.required}
                 for t in self.tools
             ],
-            "constraints": dict(self.constraints),
+            "constraints": self.constraints.copy(),
         }
 
 
 # ---- Common helper: minimal, safe rewrite policy (non-AI) ----
 
+
 def safe_minimal_rewrite(text: str) -> str:
     """
     A compact normalization pass used by V5 or as fallback by other modes.
@@ -68,12 +72,29 @@ def safe_minimal_rewrite(text: str) -> str:
     - Ensure first letter capitalized
     - Keep punctuation as-is (no hallucinations)
     """
-    import re
-
-    t = (text or "").strip()
-    t = re.sub(r"\s+", " ", t)
+    # Fast path: already clean. isprintable() is False for every whitespace char
+    # except " ", so together with the checks below nothing would change.
+    if text and text[0].isupper() and text[-1] != " " and "  " not in text and text.isprintable():
+        return text
+    # str.split() with no args trims and collapses all whitespace runs in C
+    t = " ".join((text or "").split())
     if not t:
         return ""
-    if not t[0].isupper():
-        t = t[0].upper() + t[1:]
-    return t
+    return t if t[0].isupper() else t[0].upper() + t[1:]
+
+
+# ---- Common helper: intent lookup shared by all modes ----
+
+# Intents answered from catalog.search (set literals in a function body are
+# rebuilt on every call, so keep these at module scope).
+SEARCH_INTENTS = frozenset(("search_product", "browse_category"))
+
+
+# Shared stand-in for absent ctx sub-dicts (entities/facts/session/...). Read-only,
+# so `ctx.get("facts") or EMPTY` never allocates and can't be mutated by accident.
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def ctx_intent(ctx: Dict[str, Any]) -> str:
+    """Return ctx["intent"] stripped and interned ("" when absent)."""
+    return sys.intern((ctx.get("intent") or "").strip())
@@ -12,7 +12,10 @@ This aligns with the philosophy: determinism first, AI optional.
 from __future__ import annotations
 from typing import Any, Dict
 
-from .contracts import ModeStrategy, Plan, safe_minimal_rewrite
+from .contracts import ModeStrategy, Plan, ctx_intent, safe_minimal_rewrite
+
+# Plan.to_dict() copies constraints, so one shared literal is safe.
+_CONSTRAINTS = {"no_fabrication": True, "grounding": "deterministic-only"}
 
 
 class V5Legacy(ModeStrategy):
@@ -23,11 +26,11 @@ class V5Legacy(ModeStrategy):
     # We still return a structural plan for debugging dashboards.
     def plan(self, user_text: str, ctx: Dict[str, Any]) -> Dict[str, Any]:
         # ctx can include: tenant, channel, session, intent/entities (if services pass them through)
-        intent = (ctx.get("intent") or "").strip()
+        intent = ctx_intent(ctx)
         return Plan(
             goal=f"Answer the user's request deterministically (intent='{intent}')",
             tools=[],  # V5 does not plan tool use here; retrieval already happened upstream
-            constraints={"no_fabrication": True, "grounding": "deterministic-only"},
+            constraints=_CONSTRAINTS,
         ).to_dict()
 
     # Rewrite does NOT change facts; it only trims whitespace and capitalizes.
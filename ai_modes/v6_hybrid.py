@@ -25,21 +25,13 @@ Prompts (optional) passed at construction:
 """
 
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, List, Mapping
 
-from .contracts import ModeStrategy, safe_minimal_rewrite
+from .base import GroundedMode
+from .contracts import EMPTY, SEARCH_INTENTS, safe_minimal_rewrite
 
 
-_DEFAULT_CLARIFIERS = {
-    "check_delivery": "What’s your postcode (e.g., E1 6AN)?",
-    "search_product": "Which product or category are you after?",
-    "price_check": "Which SKU should I check the price for?",
-    "faq": "Could you clarify your question?",
-    "unknown": "Could you clarify what you need?",
-}
-
-
-class AIV6Hybrid(ModeStrategy):
+class AIV6Hybrid(GroundedMode):
     """
     V6 Hybrid — light AI polish, no hallucinations, fully grounded.
     """
@@ -51,12 +43,7 @@ class AIV6Hybrid(ModeStrategy):
         self.sales = sales
 
         # optional prompt config
-        self.prompts = deps.get("prompts") or {}
-        self.clarifiers = {
-            **_DEFAULT_CLARIFIERS,
-            **(self.prompts.get("clarifiers") or {}),
-        }
-        self.offers = self.prompts.get("offers") or {}
+        self._init_prompts(deps.get("prompts"))
 
         # V6 is intentionally concise
         self.concise = True
@@ -67,53 +54,61 @@ class AIV6Hybrid(ModeStrategy):
     def name(self) -> str:
         return "AIV6"
 
-    def plan(self, user_text: str, ctx: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Provide a deterministic “plan” for diagnostics only.
-        Router and services still handle real work.
-        """
-        intent = (ctx.get("intent") or "").strip()
-        ent = ctx.get("entities") or {}
-        tools: list[dict] = []
-
-        # Delivery-related
-        if intent == "check_delivery" and (ent.get("postcode") or ctx.get("session", {}).get("postcode")):
-            tools.append({"name": "policy.delivery_rule_for", "args": {"postcode": ent.get("postcode")}})
-            tools.append({"name": "geo.nearest_for_postcode", "args": {"postcode": ent.get("postcode")}})
-
-        # Product search
-        if intent in {"search_product", "browse_category"}:
-            tools.append({
-                "name": "catalog.search",
-                "args": {"query": ent.get("query"), "tags": ent.get("tags"), "limit": 6}
-            })
-
-        # Price check
-        if intent == "price_check" and ent.get("sku"):
-            tools.append({"name": "catalog.price_of", "args": {"sku": ent.get("sku")}})
-
+    # -------------------------
+    # Plan (diagnostics only — router and services still handle real work)
+    # -------------------------
+    def _plan_with(self, intent: str, tools: List[dict]) -> Dict[str, Any]:
         return {
             "goal": f"Rewrite grounded draft for intent={intent}",
             "tools": tools,
             "constraints": {"no_fabrication": True, "concise": self.concise},
         }
 
+    def _plan_delivery(self, user_text: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any]) -> Dict[str, Any]:
+        if not (ent.get("postcode") or (ctx.get("session") or EMPTY).get("postcode")):
+            return self._plan_with(intent, [])
+        return self._plan_with(intent, [
+            {"name": "policy.delivery_rule_for", "args": {"postcode": ent.get("postcode")}},
+            {"name": "geo.nearest_for_postcode", "args": {"postcode": ent.get("postcode")}},
+        ])
+
+    def _plan_search(self, user_text: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any]) -> Dict[str, Any]:
+        return self._plan_with(intent, [{
+            "name": "catalog.search",
+            "args": {"query": ent.get("query"), "tags": ent.get("tags"), "limit": 6}
+        }])
+
+    def _plan_price(self, user_text: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any]) -> Dict[str, Any]:
+        if not ent.get("sku"):
+            return self._plan_with(intent, [])
+        return self._plan_with(intent, [{"name": "catalog.price_of", "args": {"sku": ent.get("sku")}}])
+
+    def _plan_default(self, user_text: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any]) -> Dict[str, Any]:
+        return self._plan_with(intent, [])
+
+    _PLAN_HANDLERS = {
+        "check_delivery": _plan_delivery,
+        **dict.fromkeys(SEARCH_INTENTS, _plan_search),
+        "price_check": _plan_price,
+    }
+
     # -------------------------
     # Core rewrite logic
     # -------------------------
-    def rewrite(self, draft: str, ctx: Dict[str, Any]) -> str:
+    # V6 answers from whichever facts are present (in priority order) rather
+    # than by intent, so _REWRITE_HANDLERS stays empty and every intent lands here.
+    def _rewrite_default(
+        self, draft: str, ctx: Dict[str, Any], intent: str, ent: Mapping[str, Any], facts: Mapping[str, Any]
+    ) -> str:
         """
         Apply a *light* AI polish:
         - Never changes facts
         - Short, neat, ~1–2 sentences
         - Uses deterministic info passed inside ctx["facts"]
         """
-        intent = (ctx.get("intent") or "").strip() or "unknown"
-        ent = ctx.get("entities") or {}
-        facts = ctx.get("facts") or {}
-
-        # 1) Clarifier requested
-        if draft.lower().startswith("could you clarify") or draft.lower().startswith("which"):
+        # 1) Clarifier requested (only the head is lowercased, not the whole draft)
+        head = (draft or "")[:20].lower()
+        if head.startswith(("could you clarify", "which")):
             return self._clarifier(intent)
 
         # 2) Delivery responses
@@ -149,22 +144,3 @@ class AIV6Hybrid(ModeStrategy):
 
         # 6) Default safe rewrite
         return self._cta(safe_minimal_rewrite(draft))
-
-    # -------------------------
-    # helpers
-    # -------------------------
-    def _clarifier(self, intent: str) -> str:
-        return (
-            self.clarifiers.get(intent)
-            or _DEFAULT_CLARIFIERS.get(intent)
-            or _DEFAULT_CLARIFIERS["unknown"]
-        )
-
-    def _cta(self, text: str) -> str:
-        """Adds a light CTA — V6 is minimal and non-salesy."""
-        t = text.strip()
-        if not t or t.endswith("?"):
-            return t
-        if t.lower().endswith(("anything else.", "anything else")):
-            return t
-        return f"{t} Anything else you’d like to check?"
@@ -5,21 +5,54 @@ Exports:
 - compute_kpis(events)                -> dict
 - compute_rollups(events, by="day")   -> dict
 - summarize_tenant(events, tenant)    -> dict
+- StreamingKpiAggregator              incremental compute_kpis (add/snapshot)
 - export_csv(rows, path)              -> str
 - export_to_sheets(rows, sheets_ctx)  -> dict
+- validate_event(event)               -> dict (coerced once at ingest)
 
 Connections:
 - services/analytics_service.py calls compute_* to build chart payloads.
 - routes/analytics_routes.py uses exporters for CSV/Sheets.
+
+Exports resolve lazily on first access (PEP 562), so importing the package
+for metrics alone never loads the exporters (csv, optional pyarrow).
 """
 
-from .metrics import compute_kpis, compute_rollups, summarize_tenant
-from .exporters import export_csv, export_to_sheets
+from __future__ import annotations
+import importlib
+from typing import Any, Dict
 
 __all__ = [
     "compute_kpis",
     "compute_rollups",
     "summarize_tenant",
+    "StreamingKpiAggregator",
     "export_csv",
     "export_to_sheets",
+    "validate_event",
 ]
+
+# name -> submodule that defines it
+_LAZY: Dict[str, str] = {
+    "compute_kpis": "analytics.metrics",
+    "compute_rollups": "analytics.metrics",
+    "summarize_tenant": "analytics.metrics",
+    "StreamingKpiAggregator": "analytics.metrics",
+    "export_csv": "analytics.exporters",
+    "export_to_sheets": "analytics.exporters",
+    "validate_event": "analytics.schema",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        mod = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(mod), name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
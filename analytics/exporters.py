@@ -2,16 +2,21 @@
 Analytics exporters — CSV and Google Sheets bulk.
 
 Contracts:
-- export_csv(rows, path) -> str
+- export_csv(rows, path, *, fieldnames=None) -> str
     rows: Iterable[Mapping[str, Any]]  (flat dicts)
     path: filesystem path to write CSV
+    fieldnames: optional fixed header; when given, rows are streamed
+                without being snapshotted in memory (extra keys dropped)
+    engine: "csv" (stdlib, default) or "pyarrow" (C++ writer for large
+            dumps; falls back to stdlib when pyarrow is not installed)
     returns: path
 
-- export_to_sheets(rows, sheets_ctx) -> dict
+- export_to_sheets(rows, sheets_ctx, ..., batch_size=5000) -> dict
     rows: Iterable[Mapping[str, Any]]
-    sheets_ctx: an object with method append_rows(sheet_name, header, rows)
-                (provided by connectors/sheets.py or an adapter in routes)
-    returns: {"sheet": str, "written": int}
+    sheets_ctx: an object with method append_rows(sheet_name, rows) -> int
+                (provided by connectors/sheets.py or an adapter in routes);
+                called once for the header and once per batch_size rows
+    returns: {"sheet": str, "written": int}  (sum over all append_rows calls)
 
 Notes:
 - Keep exports tolerant to missing keys; union of all keys becomes CSV header.
@@ -20,26 +25,101 @@ Notes:
 
 from __future__ import annotations
 import csv
-from typing import Any, Iterable, Mapping, Set, List
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
 
 
-def _collect_header(rows: Iterable[Mapping[str, Any]]) -> List[str]:
+def _collect_header(rows: Iterable[Mapping[str, Any]]) -> Tuple[List[str], List[Mapping[str, Any]]]:
+    snapshot = list(rows)
+    if not snapshot:
+        return [], snapshot
+    # Fast path: events from one source nearly always share a key set, and a
+    # C-level keys-view comparison per row is far cheaper than a set union.
+    # all() stops at the first mismatch, so mixed input pays little for trying.
+    first = snapshot[0].keys()
+    if all(r.keys() == first for r in snapshot):
+        return sorted(map(str, first)), snapshot
     keyset: Set[str] = set()
-    snapshot = []
-    for r in rows:
-        snapshot.append(r)
+    for r in snapshot:
         keyset.update(map(str, r.keys()))
-    header = sorted(keyset)
-    return header, snapshot
+    return sorted(keyset), snapshot
 
 
-def export_csv(rows: Iterable[Mapping[str, Any]], path: str) -> str:
-    header, snapshot = _collect_header(rows)
+def _collect_columns(rows: Iterable[Mapping[str, Any]]) -> Tuple[List[str], Dict[str, List[Any]]]:
+    """
+    Single pass: gather rows column-wise (key -> values), padding gaps with "".
+    Header is the sorted union of keys, as with _collect_header.
+    """
+    columns: Dict[str, List[Any]] = {}
+    n = 0
+    for r in rows:
+        for k, v in r.items():
+            k = str(k)
+            col = columns.get(k)
+            if col is None:
+                col = columns[k] = [""] * n
+            col.append(v)
+        n += 1
+        if len(r) != len(columns):
+            for col in columns.values():
+                if len(col) < n:
+                    col.append("")
+    return sorted(columns), columns
+
+
+def _row_values(rows: Iterable[Mapping[str, Any]], header: List[str]) -> Iterator[List[Any]]:
+    """Yield each row as a list aligned to header ("" for missing keys)."""
+    for r in rows:
+        get = r.get  # bind once per row, not once per column
+        yield [get(k, "") for k in header]
+
+
+def _write_csv_pyarrow(path: str, header: List[str], columns: Dict[str, List[Any]]) -> bool:
+    """Write columns via pyarrow's C++ CSV writer. Returns False if pyarrow is missing."""
+    try:
+        import pyarrow as pa  # optional, heavy: import only when asked for
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return False
+    # Stringify like csv.writer does (None -> ""), so both engines agree on output.
+    arrays = [
+        pa.array(["" if v is None else str(v) for v in columns[k]], type=pa.string())
+        for k in header
+    ]
+    table = pa.Table.from_arrays(arrays, names=header)
+    pa_csv.write_csv(table, path)
+    return True
+
+
+def export_csv(
+    rows: Iterable[Mapping[str, Any]],
+    path: str,
+    *,
+    fieldnames: Optional[List[str]] = None,
+    engine: str = "csv",
+) -> str:
+    if engine == "pyarrow" and fieldnames is None:
+        header, columns = _collect_columns(rows)
+        if not _write_csv_pyarrow(path, header, columns):
+            # pyarrow not installed → stdlib writer on the columns we already hold
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(header)
+                w.writerows(zip(*(columns[k] for k in header)))
+        return path
+
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=header, extrasaction="ignore")
-        w.writeheader()
-        for r in snapshot:
-            w.writerow({k: r.get(k, "") for k in header})
+        w = csv.writer(f)
+        if fieldnames is not None:
+            # Known schema → stream rows straight through, no snapshot.
+            header = list(fieldnames)
+            w.writerow(header)
+            w.writerows(_row_values(rows, header))
+        else:
+            # Unknown schema → collect column-wise, then zip columns back into rows.
+            header, columns = _collect_columns(rows)
+            w.writerow(header)
+            w.writerows(zip(*(columns[k] for k in header)))
     return path
 
 
@@ -48,14 +128,20 @@ def export_to_sheets(
     sheets_ctx: Any,
     sheet_name: str = "analytics_events",
     include_header: bool = True,
+    batch_size: int = 5000,
 ) -> dict:
     header, snapshot = _collect_header(rows)
-    values = []
-    if include_header:
-        values.append(header)
-    for r in snapshot:
-        values.append([r.get(k, "") for k in header])
+    batch_size = max(1, int(batch_size))
+    written = 0
 
-    # Expect sheets_ctx to implement: append_rows(sheet_name, rows: List[List[str]])
-    written = sheets_ctx.append_rows(sheet_name, values)
+    # Expect sheets_ctx to implement: append_rows(sheet_name, rows: List[List[str]]).
+    # It is called once per batch so only batch_size rows are formatted at a time.
+    if include_header:
+        written += sheets_ctx.append_rows(sheet_name, [header]) or 0
+    values = _row_values(snapshot, header)
+    while True:
+        batch = list(islice(values, batch_size))
+        if not batch:
+            break
+        written += sheets_ctx.append_rows(sheet_name, batch) or 0
     return {"sheet": sheet_name, "written": written}
@@ -22,7 +22,8 @@ KPIs:
 - deflection_rate          = deflected / total
 - offer_ctr                = offer_clicked / offer_shown
 - avg_latency_ms
-- first_response_p50_ms    (approx)
+- p50_latency_ms           (exact up to 10k samples, P² estimate above;
+                            p50_latency_ms_exact says which)
 - resolution_rate          = resolved / total
 - intent_top_n             (counts)
 - item_search_top_n        (from intent="catalog.search" + extracted item/tag if present)
@@ -30,20 +31,43 @@ KPIs:
 Rollups:
 - by day/hour/channel/tenant with the same KPIs.
 
+Streaming:
+- StreamingKpiAggregator folds events in one at a time and snapshots the
+  compute_kpis dict without rescanning history.
+
+Inputs:
+- compute_kpis / compute_rollups / summarize_tenant accept either an iterable
+  of event dicts or an EventColumns (column-per-field) batch; dicts are
+  converted once on entry. EventColumns.from_jsonl() loads a log directly.
+
 Notes:
-- Pure functions (no I/O), safe for unit tests.
+- Pure functions (no I/O apart from EventColumns.from_jsonl), safe for unit tests.
+- summarize_tenant memoizes its result in a small process-local LRU and
+  hands each caller its own copy.
 - Time parsing via datetime.fromisoformat fallback helper.
+- from_jsonl parses lines with orjson when installed (stdlib json otherwise).
 """
 
 from __future__ import annotations
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+from collections import Counter, OrderedDict, defaultdict
+import copy
+import threading
+import time
+from array import array
+from dataclasses import dataclass, field, fields
+from operator import itemgetter
 from datetime import datetime, timezone
+from hashlib import blake2b
+from itertools import repeat
 from statistics import median
-from typing import Any, Dict, Iterable, List, Tuple
+from sys import intern
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import json_codec as codec
 
 
 ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+_NAN = float("nan")
 
 
 def _parse_ts(ts: str) -> datetime:
@@ -58,45 +82,294 @@ def _parse_ts(ts: str) -> datetime:
         return datetime.strptime(t, ISO_FMT).replace(tzinfo=timezone.utc)
 
 
-def _safe_bool(v: Any) -> bool:
-    return bool(v) is True
+def _time_bounds(timestamps: Sequence[str]) -> Tuple[datetime | None, datetime | None]:
+    """
+    (earliest, latest) of ISO timestamps.
 
+    Same-length "...Z" strings (the emitter's fixed UTC format) sort
+    lexicographically in time order, so only the two extremes get parsed.
+    Anything else (offsets, mixed precision) parses every value.
+    """
+    if not timestamps:
+        return None, None
+    if len(set(map(len, timestamps))) == 1 and all(map(str.endswith, timestamps, repeat("Z"))):
+        return _parse_ts(min(timestamps)), _parse_ts(max(timestamps))
+    times = [_parse_ts(ts) for ts in timestamps]
+    return min(times), max(times)
 
-def compute_kpis(events: Iterable[Dict[str, Any]], top_n: int = 10) -> Dict[str, Any]:
-    events = list(events)
-    total = len(events)
-    if total == 0:
-        return {
-            "total": 0,
-            "deflection_rate": 0.0,
-            "offer_ctr": 0.0,
-            "avg_latency_ms": 0.0,
-            "p50_latency_ms": 0.0,
-            "resolution_rate": 0.0,
-            "top_intents": [],
-            "top_channels": [],
-            "time_range": None,
-        }
-
-    deflected = sum(1 for e in events if _safe_bool(e.get("deflected")))
-    offer_shown = sum(1 for e in events if _safe_bool(e.get("offer_shown")))
-    offer_clicked = sum(1 for e in events if _safe_bool(e.get("offer_clicked")))
-    resolved = sum(1 for e in events if _safe_bool(e.get("resolved")))
-    latencies = [float(e.get("latency_ms", 0.0)) for e in events if e.get("latency_ms") is not None]
-
-    intents = Counter(str(e.get("intent", "unknown")) for e in events)
-    channels = Counter(str(e.get("channel", "unknown")) for e in events)
-
-    # Time bounds
-    times = sorted(_parse_ts(str(e.get("timestamp"))) for e in events if e.get("timestamp"))
-    t0, t1 = (times[0], times[-1]) if times else (None, None)
-
-    kpis = {
+
+class _P2Quantile:
+    """
+    P² streaming quantile estimator (Jain & Chlamtac, 1985): five markers,
+    O(1) memory and O(1) work per observation, no sorting.
+
+    ``update`` takes a batch and keeps the markers in locals for the loop;
+    ``add`` is the one-observation form for incremental feeds.
+    """
+
+    __slots__ = ("p", "count", "q", "n", "_head")
+
+    def __init__(self, p: float = 0.5):
+        self.p = p
+        self.count = 0
+        self.q: List[float] = []       # marker heights
+        self.n: List[int] = []         # marker positions (0-based)
+        self._head: List[float] = []   # first five observations
+
+    def add(self, x: float) -> None:
+        self.update((x,))
+
+    def update(self, xs: Iterable[float]) -> None:
+        it = iter(xs)
+        head = self._head
+        if self.count < 5:
+            for x in it:
+                head.append(x)
+                self.count += 1
+                if self.count == 5:
+                    self.q = sorted(head)
+                    self.n = [0, 1, 2, 3, 4]
+                    break
+            else:
+                return
+
+        p = self.p
+        q0, q1, q2, q3, q4 = self.q
+        n1, n2, n3, n4 = self.n[1:]
+        c = self.count
+        for x in it:
+            # locate cell, widen extremes, shift positions above it
+            if x < q1:
+                if x < q0:
+                    q0 = x
+                n1 += 1
+                n2 += 1
+                n3 += 1
+            elif x < q2:
+                n2 += 1
+                n3 += 1
+            elif x < q3:
+                n3 += 1
+            elif x >= q4:
+                q4 = x
+            n4 += 1
+            # desired positions depend only on the count
+            m = c * 1.0
+            c += 1
+            # adjust the three middle markers (n0 is always 0)
+            d = m * p / 2 - n1
+            if (d >= 1 and n2 - n1 > 1) or (d <= -1 and n1 > 1):
+                s = 1 if d > 0 else -1
+                qp = q1 + s / n2 * ((n1 + s) * (q2 - q1) / (n2 - n1) + (n2 - n1 - s) * (q1 - q0) / n1)
+                if not q0 < qp < q2:
+                    qp = q1 + s * ((q2 - q1) / (n2 - n1) if s > 0 else (q0 - q1) / -n1)
+                q1 = qp
+                n1 += s
+            d = m * p - n2
+            if (d >= 1 and n3 - n2 > 1) or (d <= -1 and n1 - n2 < -1):
+                s = 1 if d > 0 else -1
+                qp = q2 + s / (n3 - n1) * ((n2 - n1 + s) * (q3 - q2) / (n3 - n2) + (n3 - n2 - s) * (q2 - q1) / (n2 - n1))
+                if not q1 < qp < q3:
+                    qp = q2 + s * ((q3 - q2) / (n3 - n2) if s > 0 else (q1 - q2) / (n1 - n2))
+                q2 = qp
+                n2 += s
+            d = m * (1 + p) / 2 - n3
+            if (d >= 1 and n4 - n3 > 1) or (d <= -1 and n2 - n3 < -1):
+                s = 1 if d > 0 else -1
+                qp = q3 + s / (n4 - n2) * ((n3 - n2 + s) * (q4 - q3) / (n4 - n3) + (n4 - n3 - s) * (q3 - q2) / (n3 - n2))
+                if not q2 < qp < q4:
+                    qp = q3 + s * ((q4 - q3) / (n4 - n3) if s > 0 else (q2 - q3) / (n2 - n3))
+                q3 = qp
+                n3 += s
+        self.q = [q0, q1, q2, q3, q4]
+        self.n = [0, n1, n2, n3, n4]
+        self.count = c
+
+    def value(self) -> float:
+        if self.count < 5:
+            # too few observations for markers: exact
+            return median(self._head) if self._head else 0.0
+        return self.q[2]
+
+
+# Above this many latencies p50 is estimated with P² instead of sorting them all.
+_EXACT_P50_MAX = 10_000
+
+
+def _p50(latencies: Sequence[float]) -> Tuple[float, bool]:
+    """(p50, exact?) — exact median for small inputs, P² estimate for large ones."""
+    if len(latencies) <= _EXACT_P50_MAX:
+        return median(latencies), True
+    est = _P2Quantile(0.5)
+    est.update(latencies)
+    return est.value(), False
+
+
+_EMPTY_KPIS: Dict[str, Any] = {
+    "total": 0,
+    "deflection_rate": 0.0,
+    "offer_ctr": 0.0,
+    "avg_latency_ms": 0.0,
+    "p50_latency_ms": 0.0,
+    "p50_latency_ms_exact": True,
+    "resolution_rate": 0.0,
+    "top_intents": [],
+    "top_channels": [],
+    "time_range": None,
+}
+
+
+@dataclass(slots=True)
+class EventColumns:
+    """
+    Events as row-aligned columns (SoA): one list per contract field instead
+    of one dict per event. KPI reductions run over these lists — sum() and
+    Counter() count in C — and rollups group rows by index (see take()).
+
+    Storage is kept compact: flags are one byte per row (bytearray), latency
+    is float64 (array "d", so KPIs match the dict path exactly) with NaN for
+    "missing", and tenant/channel/intent are interned so repeated labels
+    share one str object. A missing timestamp stays None so rows remain
+    aligned.
+    """
+    timestamp: List[str | None] = field(default_factory=list)
+    tenant: List[str] = field(default_factory=list)
+    channel: List[str] = field(default_factory=list)
+    intent: List[str] = field(default_factory=list)
+    resolved: bytearray = field(default_factory=bytearray)
+    deflected: bytearray = field(default_factory=bytearray)
+    offer_shown: bytearray = field(default_factory=bytearray)
+    offer_clicked: bytearray = field(default_factory=bytearray)
+    latency_ms: "array[float]" = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.intent)
+
+    @classmethod
+    def from_dicts(cls, events: Iterable[Dict[str, Any]]) -> "EventColumns":
+        """Single pass over event dicts (any iterable, consumed once)."""
+        cols = cls()
+        timestamp, tenant = cols.timestamp.append, cols.tenant.append
+        channel, intent = cols.channel.append, cols.intent.append
+        resolved, deflected = cols.resolved.append, cols.deflected.append
+        offer_shown, offer_clicked = cols.offer_shown.append, cols.offer_clicked.append
+        latency = cols.latency_ms.append
+        for e in events:
+            get = e.get
+            ts = get("timestamp")
+            timestamp(str(ts) if ts else None)
+            tenant(intern(str(get("tenant"))))
+            channel(intern(str(get("channel", "unknown"))))
+            intent(intern(str(get("intent", "unknown"))))
+            resolved(bool(get("resolved")))
+            deflected(bool(get("deflected")))
+            offer_shown(bool(get("offer_shown")))
+            offer_clicked(bool(get("offer_clicked")))
+            lat = get("latency_ms")
+            latency(_NAN if lat is None else float(lat))
+        return cols
+
+    @classmethod
+    def from_jsonl(cls, path: str) -> "EventColumns":
+        """Stream a JSON-lines event log straight into columns (blank lines skipped)."""
+        with open(path, "rb") as f:
+            return cls.from_dicts(codec.loads(line) for line in f if line.strip())
+
+    def take(self, idx: List[int]) -> "EventColumns":
+        """Row subset of every column; itemgetter gathers the rows in C."""
+        if not idx:
+            return EventColumns()
+        if len(idx) == 1:
+            # slicing keeps each column's container type (list/bytearray/array)
+            i = idx[0]
+            return EventColumns(*(getattr(self, name)[i:i + 1] for name in _EVENT_FIELDS))
+        pick = itemgetter(*idx)
+        return EventColumns(*(_gather(getattr(self, name), pick) for name in _EVENT_FIELDS))
+
+    def _view(self, idx: List[int]) -> "EventColumns | _ColumnsView":
+        """Row subset for a single KPI reduction (see _ColumnsView)."""
+        if len(idx) < 2:
+            return self.take(idx)
+        pick = itemgetter(*idx)
+        return _ColumnsView(*(pick(getattr(self, name)) for name in _VIEW_FIELDS))
+
+
+@dataclass(slots=True)
+class _ColumnsView:
+    """
+    Read-only row subset of an EventColumns for a KPI reduction: each column
+    is the raw tuple from one itemgetter gather — no container rebuild per
+    column, and tenant (unused by the KPIs) is not gathered at all.
+    """
+    timestamp: Sequence[str | None]
+    channel: Sequence[str]
+    intent: Sequence[str]
+    resolved: Sequence[int]
+    deflected: Sequence[int]
+    offer_shown: Sequence[int]
+    offer_clicked: Sequence[int]
+    latency_ms: Sequence[float]
+
+    def __len__(self) -> int:
+        return len(self.intent)
+
+
+_EVENT_FIELDS = tuple(f.name for f in fields(EventColumns))
+_VIEW_FIELDS = tuple(f.name for f in fields(_ColumnsView))
+
+
+def _gather(col: Any, pick: itemgetter) -> Any:
+    rows = pick(col)
+    if isinstance(col, array):
+        return array(col.typecode, rows)
+    return type(col)(rows)
+
+Events = Iterable[Dict[str, Any]] | EventColumns
+
+
+def _as_columns(events: Events) -> EventColumns:
+    return events if isinstance(events, EventColumns) else EventColumns.from_dicts(events)
+
+
+def _present(col: Sequence[Any]) -> Sequence[Any]:
+    # `None in col` is a C-level scan; only copy when something is missing
+    return [v for v in col if v is not None] if None in col else col
+
+
+def _latencies(col: Sequence[float]) -> Tuple[Sequence[float], float]:
+    """(present latencies, their sum). NaN marks a missing latency."""
+    # A NaN anywhere makes the C-level sum NaN (NaN != NaN); only then is a
+    # filtered copy needed — otherwise the column itself is returned.
+    total = sum(col)
+    if total == total:
+        return col, total
+    present = [v for v in col if v == v]
+    return present, sum(present)
+
+
+def _kpi_dict(
+    total: int,
+    deflected: int,
+    offer_shown: int,
+    offer_clicked: int,
+    resolved: int,
+    n_latency: int,
+    latency_sum: float,
+    p50: Tuple[float, bool],
+    intents: Counter,
+    channels: Counter,
+    t0: datetime | None,
+    t1: datetime | None,
+    top_n: int,
+) -> Dict[str, Any]:
+    # Shared by the batch (_kpis_from_columns) and streaming aggregators
+    return {
         "total": total,
         "deflection_rate": round(deflected / total, 4),
         "offer_ctr": round((offer_clicked / offer_shown), 4) if offer_shown else 0.0,
-        "avg_latency_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
-        "p50_latency_ms": round(median(latencies), 2) if latencies else 0.0,
+        "avg_latency_ms": round(latency_sum / n_latency, 2) if n_latency else 0.0,
+        "p50_latency_ms": round(p50[0], 2),
+        "p50_latency_ms_exact": p50[1],
         "resolution_rate": round(resolved / total, 4),
         "top_intents": intents.most_common(top_n),
         "top_channels": channels.most_common(top_n),
@@ -106,7 +379,150 @@ def compute_kpis(events: Iterable[Dict[str, Any]], top_n: int = 10) -> Dict[str,
             "days": (t1 - t0).days + 1 if t0 and t1 else 0,
         },
     }
-    return kpis
+
+
+def _kpis_from_columns(cols: EventColumns | _ColumnsView, top_n: int = 10) -> Dict[str, Any]:
+    total = len(cols)
+    if total == 0:
+        return dict(_EMPTY_KPIS, top_intents=[], top_channels=[])
+
+    latencies, latency_sum = _latencies(cols.latency_ms)
+    t0, t1 = _time_bounds(_present(cols.timestamp))
+    return _kpi_dict(
+        total,
+        sum(cols.deflected),
+        sum(cols.offer_shown),
+        sum(cols.offer_clicked),
+        sum(cols.resolved),
+        len(latencies),
+        latency_sum,
+        _p50(latencies) if latencies else (0.0, True),
+        Counter(cols.intent),
+        Counter(cols.channel),
+        t0,
+        t1,
+        top_n,
+    )
+
+
+def compute_kpis(events: Events, top_n: int = 10) -> Dict[str, Any]:
+    return _kpis_from_columns(_as_columns(events), top_n=top_n)
+
+
+class StreamingKpiAggregator:
+    """
+    Incremental compute_kpis: add() folds in one event in O(1), snapshot()
+    returns the same dict compute_kpis would for every event added so far.
+    Keep one per tenant (AnalyticsService does) so a dashboard refresh costs
+    O(new events) instead of a rescan.
+
+    p50 stays exact (values kept) until more than _EXACT_P50_MAX latencies,
+    then the kept values seed a P² sketch and are dropped — the same switch,
+    fed in the same order, as the batch path. Timestamps are compared as
+    strings while they share the fixed "...Z" layout and parsed otherwise,
+    mirroring _time_bounds.
+    """
+
+    __slots__ = (
+        "top_n", "total", "deflected", "offer_shown", "offer_clicked", "resolved",
+        "n_latency", "latency_sum", "_exact", "_sketch", "intents", "channels",
+        "_ts_len", "_t0", "_t1",
+    )
+
+    def __init__(self, top_n: int = 10):
+        self.top_n = top_n
+        self.total = self.deflected = self.offer_shown = self.offer_clicked = self.resolved = 0
+        self.n_latency = 0
+        self.latency_sum = 0.0
+        self._exact: List[float] | None = []
+        self._sketch: _P2Quantile | None = None
+        self.intents: Counter = Counter()
+        self.channels: Counter = Counter()
+        # _ts_len: common length of "...Z" strings so far (0 = none yet,
+        # -1 = mixed, bounds are parsed datetimes from then on)
+        self._ts_len = 0
+        self._t0: Any = None
+        self._t1: Any = None
+
+    def add(self, event: Dict[str, Any]) -> None:
+        get = event.get
+        self.total += 1
+        self.deflected += bool(get("deflected"))
+        self.offer_shown += bool(get("offer_shown"))
+        self.offer_clicked += bool(get("offer_clicked"))
+        self.resolved += bool(get("resolved"))
+        self.intents[intern(str(get("intent", "unknown")))] += 1
+        self.channels[intern(str(get("channel", "unknown")))] += 1
+
+        lat = get("latency_ms")
+        if lat is not None:
+            lat = float(lat)
+            if lat == lat:  # NaN = missing
+                self.n_latency += 1
+                self.latency_sum += lat
+                exact = self._exact
+                if exact is not None:
+                    exact.append(lat)
+                    if len(exact) > _EXACT_P50_MAX:
+                        self._sketch = _P2Quantile(0.5)
+                        self._sketch.update(exact)
+                        self._exact = None
+                elif self._sketch is not None:
+                    self._sketch.add(lat)
+
+        ts = get("timestamp")
+        if ts:
+            self._add_ts(str(ts))
+
+    def update(self, events: Iterable[Dict[str, Any]]) -> None:
+        add = self.add
+        for e in events:
+            add(e)
+
+    def _add_ts(self, ts: str) -> None:
+        n = self._ts_len
+        if n >= 0 and ts[-1] == "Z" and (n == 0 or len(ts) == n):
+            self._ts_len = len(ts)
+            if self._t0 is None or ts < self._t0:
+                self._t0 = ts
+            if self._t1 is None or ts > self._t1:
+                self._t1 = ts
+            return
+        if n > 0:
+            # layout broke: switch the string bounds to datetimes
+            self._t0, self._t1 = _parse_ts(self._t0), _parse_ts(self._t1)
+        self._ts_len = -1
+        dt = _parse_ts(ts)
+        if self._t0 is None or dt < self._t0:
+            self._t0 = dt
+        if self._t1 is None or dt > self._t1:
+            self._t1 = dt
+
+    def snapshot(self) -> Dict[str, Any]:
+        if not self.total:
+            return dict(_EMPTY_KPIS, top_intents=[], top_channels=[])
+        if self._sketch is not None:
+            p50 = (self._sketch.value(), False)
+        else:
+            p50 = (median(self._exact), True) if self._exact else (0.0, True)
+        t0, t1 = self._t0, self._t1
+        if self._ts_len > 0:
+            t0, t1 = _parse_ts(t0), _parse_ts(t1)
+        return _kpi_dict(
+            self.total,
+            self.deflected,
+            self.offer_shown,
+            self.offer_clicked,
+            self.resolved,
+            self.n_latency,
+            self.latency_sum,
+            p50,
+            self.intents,
+            self.channels,
+            t0,
+            t1,
+            self.top_n,
+        )
 
 
 def _bucket_key(dt: datetime, by: str) -> str:
@@ -121,7 +537,34 @@ def _bucket_key(dt: datetime, by: str) -> str:
     return "all"
 
 
-def compute_rollups(events: Iterable[Dict[str, Any]], by: str = "day") -> Dict[str, Any]:
+def _rollups_from_columns(cols: EventColumns, by: str = "day") -> Dict[str, Any]:
+    # Group row indices by time bucket and by channel in one scan, then reduce
+    # each group's column slice — the event dicts are never touched again.
+    buckets: Dict[str, List[int]] = defaultdict(list)
+    channels: Dict[str, List[int]] = defaultdict(list)
+
+    # The bucket depends only on date + hour, which every ISO layout fixes
+    # within its first 13 chars ("YYYY-MM-DDTHH", or less for basic/week
+    # forms). Parse + strftime once per distinct prefix, not once per event.
+    memo: Dict[str, str] = {}
+    for i, (ts, ch) in enumerate(zip(cols.timestamp, cols.channel)):
+        if ts:
+            head = ts[:13]
+            key = memo.get(head)
+            if key is None:
+                key = memo[head] = _bucket_key(_parse_ts(ts), by)
+        else:
+            key = "unknown"
+        buckets[key].append(i)
+        channels[ch].append(i)
+
+    view = cols._view
+    by_time = {k: _kpis_from_columns(view(v)) for k, v in sorted(buckets.items())}
+    by_channel = {k: _kpis_from_columns(view(v)) for k, v in channels.items()}
+    return {"by_time": by_time, "by_channel": by_channel}
+
+
+def compute_rollups(events: Events, by: str = "day") -> Dict[str, Any]:
     """
     Roll up KPIs by time bucket and by channel.
     Returns:
@@ -130,31 +573,78 @@ def compute_rollups(events: Iterable[Dict[str, Any]], by: str = "day") -> Dict[s
       "by_channel": { "web": {kpis}, "wa": {kpis} }
     }
     """
-    buckets: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    channels: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-
-    for e in events:
-        ts = e.get("timestamp")
-        dt = _parse_ts(str(ts)) if ts else None
-        key = _bucket_key(dt, by) if dt else "unknown"
-        buckets[key].append(e)
-        channels[str(e.get("channel", "unknown"))].append(e)
-
-    by_time = {k: compute_kpis(v) for k, v in sorted(buckets.items())}
-    by_channel = {k: compute_kpis(v) for k, v in channels.items()}
-    return {"by_time": by_time, "by_channel": by_channel}
+    return _rollups_from_columns(_as_columns(events), by=by)
 
 
-def summarize_tenant(events: Iterable[Dict[str, Any]], tenant: str) -> Dict[str, Any]:
-    """
-    Filter events by tenant and compute a compact dashboard summary.
-    """
-    ev = [e for e in events if str(e.get("tenant")) == tenant]
-    kpis = compute_kpis(ev)
-    roll = compute_rollups(ev, by="day")
+# summarize_tenant results, LRU by (tenant, batch fingerprint). Dashboards
+# poll the same unchanged event set, so a hit skips the KPI/rollup work.
+_SUMMARY_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_SUMMARY_CACHE_MAX = 256
+_SUMMARY_LOCK = threading.Lock()
+
+
+def _fingerprint(cols: EventColumns) -> Tuple[int, bytes]:
+    """Content digest of a batch: every column the summary reads, hashed in bulk."""
+    h = blake2b(digest_size=16)
+    for labels in (cols.timestamp, cols.tenant, cols.channel, cols.intent):
+        h.update("\0".join([t or "" for t in labels]).encode())
+    for flags in (cols.resolved, cols.deflected, cols.offer_shown, cols.offer_clicked):
+        h.update(flags)
+    h.update(cols.latency_ms.tobytes())
+    return len(cols), h.digest()
+
+
+# (epoch second, its ISO string); swapped as one tuple so readers never see a
+# second paired with another second's string
+_NOW_CACHE: Tuple[int, str] = (0, "")
+
+
+def _utcnow_iso() -> str:
+    """UTC now as "YYYY-MM-DDTHH:MM:SSZ", formatted at most once per second."""
+    global _NOW_CACHE
+    t = int(time.time())
+    sec, iso = _NOW_CACHE
+    if sec != t:
+        iso = datetime.fromtimestamp(t, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _NOW_CACHE = (t, iso)
+    return iso
+
+
+def _summarize(cols: EventColumns, tenant: str) -> Dict[str, Any]:
+    # Columns are built once, masked to the tenant, and shared by the KPI and
+    # rollup reductions.
+    idx = [i for i, t in enumerate(cols.tenant) if t == tenant]
+    if len(idx) != len(cols):
+        cols = cols.take(idx)
+    kpis = _kpis_from_columns(cols)
+    roll = _rollups_from_columns(cols, by="day")
     return {
         "tenant": tenant,
         "kpis": kpis,
         "rollups": roll,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": _utcnow_iso(),
     }
+
+
+def summarize_tenant(events: Events, tenant: str) -> Dict[str, Any]:
+    """
+    Filter events by tenant and compute a compact dashboard summary.
+
+    Results are cached per (tenant, batch fingerprint): a digest of the
+    batch's columns (tens of ms per 100k events, an order of magnitude under
+    the summary itself). Every call gets its own copy, so callers may mutate
+    it freely; on a hit "generated_at" shows how old the summary is.
+    """
+    cols = _as_columns(events)
+    key = (tenant, _fingerprint(cols))
+    with _SUMMARY_LOCK:
+        hit = _SUMMARY_CACHE.get(key)
+        if hit is not None:
+            _SUMMARY_CACHE.move_to_end(key)
+            return copy.deepcopy(hit)
+    res = _summarize(cols, tenant)
+    with _SUMMARY_LOCK:
+        _SUMMARY_CACHE[key] = res
+        if len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+            _SUMMARY_CACHE.popitem(last=False)
+    return copy.deepcopy(res)
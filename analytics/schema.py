@@ -0,0 +1,41 @@
+"""
+Analytics event schema — one coercion pass at ingest.
+
+validate_event() normalises the contract fields (see analytics/metrics.py)
+so downstream reducers can trust their types instead of re-coercing on
+every KPI pass:
+
+- tenant / channel / intent -> str ("unknown" when missing or None)
+- timestamp                 -> str, or None when missing/empty
+- resolved / deflected / offer_shown / offer_clicked -> bool
+- latency_ms                -> float, or None when missing or not numeric
+
+Other keys pass through untouched.
+
+Stdlib only; no pydantic.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Mapping
+
+LABEL_FIELDS = ("tenant", "channel", "intent")
+FLAG_FIELDS = ("resolved", "deflected", "offer_shown", "offer_clicked")
+
+
+def validate_event(event: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a copy of event with contract fields coerced to their types."""
+    out = dict(event)
+    for k in LABEL_FIELDS:
+        v = out.get(k)
+        out[k] = "unknown" if v is None else v if type(v) is str else str(v)
+    ts = out.get("timestamp")
+    out["timestamp"] = (ts if type(ts) is str else str(ts)) if ts else None
+    for k in FLAG_FIELDS:
+        out[k] = bool(out.get(k))
+    lat = out.get("latency_ms")
+    try:
+        out["latency_ms"] = None if lat is None else float(lat)
+    except (TypeError, ValueError):
+        # ingest must not raise on a bad metric; treat it as missing
+        out["latency_ms"] = None
+    return out
@@ -79,7 +79,8 @@ def create_app(config_override: Dict[str, Any] | None = None) -> Flask:
     app.config["SECRET_KEY"] = settings.SECRET_KEY
     app.config["WTF_CSRF_ENABLED"] = False  # using our own lightweight CSRF
 
-    # Dependency container (stores, services, mode strategy)
+    # Dependency container (stores, services, mode strategy); read-only stores
+    # are shared per tenant, stateful services are per app
     container = Container(settings)
     app.container = container  # type: ignore[attr-defined]
 
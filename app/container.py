@@ -1,5 +1,5 @@
 """
-Container — creates and holds singletons.
+Container — creates and holds singletons (lazily, on first access).
 
 Provides:
 - Stores (retrieval/*)
@@ -9,8 +9,10 @@ Provides:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List
+import os
+import threading
+from functools import cached_property
+from typing import Callable, Dict, List, Tuple
 
 from app.config import Settings
 
@@ -35,73 +37,157 @@ from service.sales_flows import SalesFlows
 from service.message_handler import MessageHandler
 from service import HandlerDeps  # dataclass used by MessageHandler
 
-# AI modes (legacy strategy object, still required by HandlerDeps.mode)
+# AI modes (legacy strategy object, still required by HandlerDeps.mode).
+# Strategy classes resolve lazily, so only the active MODE's module is imported.
+import ai_modes
 from ai_modes.contracts import ModeStrategy
-from ai_modes.v5_legacy import V5Legacy
-from ai_modes.v6_hybrid import AIV6Hybrid
-from ai_modes.v7_flagship import AIV7Flagship
 
 
-@dataclass
+# Process-wide registry: BUSINESS_KEY -> that tenant's read-only stores.
+# create_app() calls in one process (tests, preloaded gunicorn) share the
+# parsed business JSON; anything holding mutable state is built per Container.
+# An entry is reused only while the tenant's files are unchanged, so a
+# create_app() after an admin PUT (or a hand edit) parses the new JSON.
+_STORES: Dict[str, "_TenantStores"] = {}
+_STORES_LOCK = threading.Lock()
+
+_FileStamp = Tuple[Tuple[str, int, int], ...]
+
+
+def _tenant_stamp(storage: Storage) -> _FileStamp:
+    """(name, mtime_ns, size) of each file in the tenant folder, sorted."""
+    try:
+        with os.scandir(storage.tenant_dir()) as it:
+            stats = [(e.name, e.stat()) for e in it if e.is_file()]
+    except FileNotFoundError:
+        return ()
+    return tuple(sorted((name, st.st_mtime_ns, st.st_size) for name, st in stats))
+
+
+class _TenantStores:
+    """Read-only retrieval stores for one tenant, each built on first access."""
+
+    def __init__(self, storage: Storage, stamp: _FileStamp):
+        self.storage = storage
+        self.stamp = stamp
+
+    @classmethod
+    def get(cls, business_key: str) -> "_TenantStores":
+        with _STORES_LOCK:
+            stores = _STORES.get(business_key)
+            storage = stores.storage if stores is not None else Storage(business_key)
+            stamp = _tenant_stamp(storage)
+            if stores is None or stores.stamp != stamp:
+                stores = _STORES[business_key] = cls(storage, stamp)
+            return stores
+
+    @cached_property
+    def catalog(self) -> CatalogStore:
+        return CatalogStore(self.storage)
+
+    @cached_property
+    def policy(self) -> PolicyStore:
+        return PolicyStore(self.storage)
+
+    @cached_property
+    def geo(self) -> GeoStore:
+        return GeoStore(self.storage)
+
+    @cached_property
+    def faq(self) -> FAQStore:
+        return FAQStore(self.storage)
+
+    @cached_property
+    def synonyms(self) -> SynonymsStore:
+        return SynonymsStore(self.storage)
+
+
 class Container:
-    settings: Settings
-    # Filled during __post_init__
-    mode: ModeStrategy | None = None
-    handler: MessageHandler | None = None
-
-    def __post_init__(self):
-        # ---------- Retrieval layer ----------
-        self.storage = Storage(self.settings.BUSINESS_KEY)
-        self.catalog = CatalogStore(self.storage)
-        self.policy = PolicyStore(self.storage)
-        self.geo = GeoStore(self.storage)
-        self.faq = FAQStore(self.storage)
-        self.synonyms = SynonymsStore(self.storage)
-        self.overrides = OverridesStore(self.storage)
-
-        # ---------- Services ----------
-        self.analytics = AnalyticsService(self.settings)
-        self.crm = CRMService()
-        self.memory = Memory()
-        self.rewriter = Rewriter(self.settings)
-        self.sales = SalesFlows(self.catalog)
-
-        # ---------- Router (with geo prefixes) ----------
-        coverage_prefixes: List[str] = []
-
-        # Try common attribute names on GeoStore so you don't hardcode anything
-        for attr in ("coverage_prefixes", "prefixes", "all_prefixes"):
-            if hasattr(self.geo, attr):
-                val = getattr(self.geo, attr) or []
-                if isinstance(val, list):
-                    coverage_prefixes = val
-                break
-
-        self.router = Router(
+    """
+    Stores and services are built on first access (functools.cached_property),
+    so a worker that only serves /health never reads the business JSON files.
+    Touching ``handler`` builds everything the MessageHandler needs.
+
+    Read-only stores come from the per-tenant registry; services with state
+    (analytics, CRM, memory, handler, overrides) belong to this Container.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._stores = _TenantStores.get(settings.BUSINESS_KEY)
+
+    # ---------- Retrieval layer ----------
+    @property
+    def storage(self) -> Storage:
+        return self._stores.storage
+
+    @property
+    def catalog(self) -> CatalogStore:
+        return self._stores.catalog
+
+    @property
+    def policy(self) -> PolicyStore:
+        return self._stores.policy
+
+    @property
+    def geo(self) -> GeoStore:
+        return self._stores.geo
+
+    @property
+    def faq(self) -> FAQStore:
+        return self._stores.faq
+
+    @property
+    def synonyms(self) -> SynonymsStore:
+        return self._stores.synonyms
+
+    @cached_property
+    def overrides(self) -> OverridesStore:
+        return OverridesStore(self.storage)
+
+    # ---------- Services ----------
+    @cached_property
+    def analytics(self) -> AnalyticsService:
+        return AnalyticsService(self.settings)
+
+    @cached_property
+    def crm(self) -> CRMService:
+        return CRMService()
+
+    @cached_property
+    def memory(self) -> Memory:
+        return Memory()
+
+    @cached_property
+    def rewriter(self) -> Rewriter:
+        return Rewriter()
+
+    @cached_property
+    def sales(self) -> SalesFlows:
+        return SalesFlows(self.catalog)
+
+    # ---------- Router (with geo prefixes) ----------
+    @cached_property
+    def router(self) -> Router:
+        # GeoStore's accessor is fixed: read it directly instead of probing
+        # attribute names (the old probe got the bound method, never the list)
+        coverage_prefixes: List[str] = self.geo.coverage_prefixes()
+
+        return Router(
             synonyms=self.synonyms,
             geo_prefixes=coverage_prefixes,
         )
 
-        # ---------- Mode strategy (needed because HandlerDeps expects `mode`) ----------
-        # Settings.MODE should be something like "V5", "V6", or "V7"
-        mode_name = (self.settings.MODE or "V7").upper()
-
-        if mode_name == "V5":
-            self.mode = V5Legacy(self.router, self.rewriter, self.sales)
-        elif mode_name == "V6":
-            self.mode = AIV6Hybrid(self.router, self.rewriter, self.sales)
-        else:
-            # default: V7 flagship
-            self.mode = AIV7Flagship(
-                self.router,
-                self.rewriter,
-                self.sales,
-                self.catalog,
-                self.policy,
-                self.geo,
-            )
-
-        # ---------- Message orchestrator ----------
+    # ---------- Mode strategy (needed because HandlerDeps expects `mode`) ----------
+    @cached_property
+    def mode(self) -> ModeStrategy:
+        # Settings.MODE should be something like "V5", "V6", or "V7"; default V7
+        build = _MODE_BUILDERS.get((self.settings.MODE or "V7").upper(), _build_v7)
+        return build(self)
+
+    # ---------- Message orchestrator ----------
+    @cached_property
+    def handler(self) -> MessageHandler:
         deps = HandlerDeps(
             mode=self.mode,           # <- REQUIRED, fixes the TypeError
             rewriter=self.rewriter,
@@ -116,5 +202,33 @@ class Container:
             synonyms=self.synonyms,
             overrides=self.overrides,
         )
+        return MessageHandler(deps)
+
+
+# ---------- Mode builders (MODE -> strategy), resolved by one dict lookup ----------
+
+def _build_v5(c: Container) -> ModeStrategy:
+    return ai_modes.V5Legacy(c.router, c.rewriter, c.sales)
+
+
+def _build_v6(c: Container) -> ModeStrategy:
+    return ai_modes.AIV6Hybrid(c.router, c.rewriter, c.sales)
+
+
+def _build_v7(c: Container) -> ModeStrategy:
+    # default: V7 flagship
+    return ai_modes.AIV7Flagship(
+        c.router,
+        c.rewriter,
+        c.sales,
+        c.catalog,
+        c.policy,
+        c.geo,
+    )
+
 
-        self.handler = MessageHandler(deps)
+_MODE_BUILDERS: Dict[str, Callable[[Container], ModeStrategy]] = {
+    "V5": _build_v5,
+    "V6": _build_v6,
+    "V7": _build_v7,
+}
@@ -17,32 +17,49 @@ business/{KEY}/overrides.json under:
 """
 
 from __future__ import annotations
-from typing import Any
+from typing import Any, Optional
 
 from app.config import Settings
 from retrieval.overrides_store import OverridesStore
 
 
 class Flags:
+    """
+    Flag values are resolved once (override, else Settings default) and kept
+    as plain attributes, so per-request reads don't walk the overrides dict.
+    OverridesStore reads its file once, so they can't go stale; refresh()
+    re-resolves them from the store.
+    """
+
     def __init__(self, settings: Settings, overrides: OverridesStore):
         self.settings = settings
         self.overrides = overrides
+        self.refresh()
+
+    def refresh(self) -> None:
+        get, s = self.overrides.get, self.settings
+        self._rewriter = _flag(get("flags.rewriter_enabled"), s.FF_REWRITER_ENABLED)
+        self._tool_use = _flag(get("flags.tool_use_enabled"), s.FF_TOOL_USE_ENABLED)
+        self._to_sheets = _flag(get("flags.analytics_to_sheets"), s.FF_ANALYTICS_TO_SHEETS)
+        v = get("thresholds.intent_confidence")
+        try:
+            self._intent_conf: Optional[float] = float(v) if v is not None else None
+        except Exception:
+            self._intent_conf = None
 
     def rewriter_enabled(self) -> bool:
-        o = self.overrides.get("flags.rewriter_enabled")
-        return bool(o if o is not None else self.settings.FF_REWRITER_ENABLED)
+        return self._rewriter
 
     def tool_use_enabled(self) -> bool:
-        o = self.overrides.get("flags.tool_use_enabled")
-        return bool(o if o is not None else self.settings.FF_TOOL_USE_ENABLED)
+        return self._tool_use
 
     def analytics_to_sheets(self) -> bool:
-        o = self.overrides.get("flags.analytics_to_sheets")
-        return bool(o if o is not None else self.settings.FF_ANALYTICS_TO_SHEETS)
+        return self._to_sheets
 
     def intent_conf_threshold(self, default: float = 0.7) -> float:
-        v = self.overrides.get("thresholds.intent_confidence")
-        try:
-            return float(v) if v is not None else default
-        except Exception:
-            return default
+        v = self._intent_conf
+        return v if v is not None else default
+
+
+def _flag(override: Any, default: bool) -> bool:
+    return bool(override if override is not None else default)
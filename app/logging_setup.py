@@ -3,12 +3,24 @@ Logging setup.
 
 - Rotating file handlers for runtime, analytics, errors
 - Request ID aware formatter
+- File and console I/O happen off the request path: loggers enqueue records
+  (QueueHandler on root) and one QueueListener thread writes them out.
+  Each file handler filters by logger name, so routing is unchanged.
+- Records are buffered per file and written in batches (one write per
+  batch): at 512 records, immediately on ERROR, every 30 s, and at exit.
+- Threads don't survive fork (gunicorn preload_app), so a forked worker
+  starts its own listener/flusher on its first log record.
 """
 
 from __future__ import annotations
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import List, Optional
 
 from app.config import Settings
 
@@ -16,20 +28,152 @@ from app.config import Settings
 class RequestIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         # Middleware stores request_id in record if present
-        if not hasattr(record, "request_id"):
-            record.request_id = "-"
+        record.__dict__.setdefault("request_id", "-")
         return True
 
 
-def _mk_handler(path: Path, level: int) -> RotatingFileHandler:
+class _LoggerNameFilter(logging.Filter):
+    """Pass records from any of the named loggers (or their children)."""
+
+    def __init__(self, *names: str):
+        super().__init__()
+        self._names = frozenset(names)
+        self._prefixes = tuple(n + "." for n in names)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = record.name
+        return name in self._names or name.startswith(self._prefixes)
+
+
+class _BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that can write a whole batch with one write()."""
+
+    def emit_batch(self, records: List[logging.LogRecord]) -> None:
+        records = [r for r in records if r.levelno >= self.level and self.filter(r)]
+        if not records:
+            return
+        try:
+            text = "".join(self.format(r) + self.terminator for r in records)
+            lock = self.lock
+            assert lock is not None  # set by Handler.__init__ (createLock)
+            with lock:
+                if self.stream is None:
+                    self.stream = self._open()
+                # rollover is checked per batch, so a file may overshoot
+                # maxBytes by at most one batch
+                if self.maxBytes > 0 and self.stream.tell() + len(text) >= self.maxBytes:
+                    self.doRollover()
+                self.stream.write(text)
+                self.stream.flush()
+        except Exception:
+            self.handleError(records[0])
+
+
+class _BatchHandler(MemoryHandler):
+    """
+    Buffers records and hands them to the file target as one batch:
+    on `capacity` records, on any ERROR, on the interval flusher, or at exit.
+    """
+
+    # always a batch-capable file handler here (None once closed)
+    target: Optional[_BatchedRotatingFileHandler]
+
+    def flush(self) -> None:
+        lock = self.lock
+        assert lock is not None  # set by Handler.__init__ (createLock)
+        with lock:
+            if self.target and self.buffer:
+                self.target.emit_batch(self.buffer)
+                self.buffer = []
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+
+_FLUSH_INTERVAL_S = 30.0
+
+
+class _Pipeline:
+    """Root QueueHandler + listener thread + interval flusher from one configure_logging()."""
+
+    def __init__(self, handlers: List[logging.Handler], batches: List[_BatchHandler]):
+        self.handlers = handlers
+        self.batches = batches
+        self.handler = _PerProcessQueueHandler(self)
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self) -> None:
+        # A fresh queue per process: a SimpleQueue copied across fork can't
+        # wake a new reader reliably.
+        self.pid = os.getpid()
+        self.handler.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.handler.queue, *self.handlers, respect_handler_level=True)
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="log-flush", daemon=True)
+        self.listener.start()
+        self._flusher.start()
+
+    def ensure_started(self) -> None:
+        """Restart the threads in a forked child (they only exist in the parent)."""
+        if self.pid == os.getpid():
+            return
+        with self._lock:
+            if self.pid == os.getpid():
+                return
+            # Buffered records copied from the parent are the parent's to
+            # write; drop them so the child doesn't duplicate them.
+            for b in self.batches:
+                b.buffer = []
+            self._start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(_FLUSH_INTERVAL_S):
+            self.flush()
+
+    def flush(self) -> None:
+        for b in self.batches:
+            b.flush()
+
+    def stop(self) -> None:
+        # drain the queue first, then write out whatever is buffered; a forked
+        # child that never logged has no threads of its own to stop
+        if self._stop.is_set() or self.pid != os.getpid():
+            return
+        self._stop.set()
+        self.listener.stop()
+        self.flush()
+
+
+class _PerProcessQueueHandler(QueueHandler):
+    """Root handler: enqueues for this process's listener, starting it after a fork."""
+
+    def __init__(self, pipeline: _Pipeline):
+        # placeholder; _Pipeline._start swaps in a fresh queue per process
+        super().__init__(queue.SimpleQueue())
+        self._pipeline = pipeline
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._pipeline.ensure_started()
+        self.queue.put_nowait(record)
+
+
+_PIPELINE: Optional[_Pipeline] = None
+
+
+def _mk_handler(path: Path, level: int) -> _BatchHandler:
     path.parent.mkdir(parents=True, exist_ok=True)
-    handler = RotatingFileHandler(path, maxBytes=5_000_000, backupCount=3, encoding="utf-8")
-    handler.setLevel(level)
+    target = _BatchedRotatingFileHandler(path, maxBytes=5_000_000, backupCount=3, encoding="utf-8")
     fmt = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s %(request_id)s - %(message)s"
     )
-    handler.setFormatter(fmt)
-    handler.addFilter(RequestIdFilter())
+    target.setFormatter(fmt)
+    target.addFilter(RequestIdFilter())
+    handler = _BatchHandler(capacity=512, flushLevel=logging.ERROR, target=target)
+    handler.setLevel(level)
     return handler
 
 
@@ -41,7 +185,6 @@ def configure_logging(settings: Settings) -> None:
     console = logging.StreamHandler()
     console.setLevel(logging.INFO)
     console.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s - %(message)s"))
-    root.addHandler(console)
 
     # Files
     logs_dir = Path("logs")
@@ -49,8 +192,26 @@ def configure_logging(settings: Settings) -> None:
     errors = _mk_handler(logs_dir / "errors.log", logging.ERROR)
     analytics = _mk_handler(logs_dir / "analytics.log", logging.INFO)
 
-    logging.getLogger("Runtime").addHandler(runtime)
-    logging.getLogger("Heartbeat").addHandler(runtime)
-    logging.getLogger("Probes").addHandler(runtime)
-    logging.getLogger("Analytics").addHandler(analytics)
-    logging.getLogger().addHandler(errors)
+    runtime.addFilter(_LoggerNameFilter("Runtime", "Heartbeat", "Probes"))
+    analytics.addFilter(_LoggerNameFilter("Analytics"))
+
+    # Every logger propagates to root, and root's only handler enqueues: a
+    # record costs one handler call on the emitting thread. The listener
+    # thread echoes it to the console and buffers it for the files.
+    global _PIPELINE
+    if _PIPELINE is not None:
+        # re-configured (e.g. another create_app): drain and replace
+        root.removeHandler(_PIPELINE.handler)
+        _PIPELINE.stop()
+    _PIPELINE = _Pipeline(
+        [console, runtime, analytics, errors],
+        [runtime, analytics, errors],
+    )
+    root.addHandler(_PIPELINE.handler)
+
+
+@atexit.register
+def _stop_pipeline() -> None:
+    # flush queued and buffered records on shutdown
+    if _PIPELINE is not None:
+        _PIPELINE.stop()
@@ -4,14 +4,20 @@ Middleware installers for Flask.
 - Request ID injection
 - IP-based rate limiting (simple token bucket)
 - CSRF token check for admin forms/JSON (custom header)
-- Timing metrics → AnalyticsService
+- Timing metrics → AnalyticsService (buffered, flushed in bulk every second)
 """
 
 from __future__ import annotations
-import time
-import uuid
-from collections import defaultdict
-from typing import Dict
+import atexit
+import hmac
+import os
+import secrets
+import threading
+import weakref
+from array import array
+from collections import deque
+from time import monotonic, monotonic_ns
+from typing import Deque, Optional, Tuple
 
 from flask import Flask, g, request, abort
 
@@ -21,7 +27,7 @@ from app.config import Settings
 def install_request_id(app: Flask) -> None:
     @app.before_request
     def _req_id():
-        g.request_id = request.headers.get("X-Request-ID") or f"req_{uuid.uuid4().hex[:12]}"
+        g.request_id = request.headers.get("X-Request-ID") or "req_" + secrets.token_hex(6)
 
     @app.after_request
     def _stamp(response):
@@ -30,21 +36,48 @@ def install_request_id(app: Flask) -> None:
         return response
 
 
+# Rate-limit bucket slots (power of two). Memory is fixed at install time; IPs
+# whose hashes collide share a bucket, which only ever makes limiting stricter.
+_RL_SLOTS = 1 << 16
+
+
+def _tb_allow(
+    tokens: "array[float]",
+    stamps: "array[float]",
+    i: int,
+    cap: float,
+    initial: float,
+    rate_per_s: float,
+    now: float,
+) -> bool:
+    """
+    Token bucket per minute with burst: refill slot i up to cap, then take one
+    token if available. Mutates tokens/stamps in place; the caller holds the lock.
+    """
+    last = stamps[i]
+    tok = min(cap, tokens[i] + (now - last) * rate_per_s) if last else initial
+    stamps[i] = now
+    if tok >= 1.0:
+        tokens[i] = tok - 1.0
+        return True
+    tokens[i] = tok
+    return False
+
+
 def install_rate_limit(app: Flask, settings: Settings) -> None:
     # naive in-proc limiter; replace with Redis in prod multi-instance
-    buckets: Dict[str, Dict[str, float]] = defaultdict(lambda: {"tokens": settings.RATE_LIMIT_PER_MIN, "ts": time.time()})
+    per_min = float(settings.RATE_LIMIT_PER_MIN)
+    cap = per_min + settings.RATE_LIMIT_BURST
+    rate = per_min / 60.0
+    mask = _RL_SLOTS - 1
+    # token bucket per slot; ts == 0.0 marks a slot never used
+    tokens = array("d", bytes(8 * _RL_SLOTS))
+    stamps = array("d", bytes(8 * _RL_SLOTS))
+    lock = threading.Lock()
 
     def allow(ip: str) -> bool:
-        # token bucket per minute with burst
-        now = time.time()
-        b = buckets[ip]
-        refill = (now - b["ts"]) * (settings.RATE_LIMIT_PER_MIN / 60.0)
-        b["tokens"] = min(settings.RATE_LIMIT_PER_MIN + settings.RATE_LIMIT_BURST, b["tokens"] + refill)
-        b["ts"] = now
-        if b["tokens"] >= 1.0:
-            b["tokens"] -= 1.0
-            return True
-        return False
+        with lock:
+            return _tb_allow(tokens, stamps, hash(ip) & mask, cap, per_min, rate, monotonic())
 
     @app.before_request
     def _rl():
@@ -54,36 +87,118 @@ def install_rate_limit(app: Flask, settings: Settings) -> None:
             abort(429)
 
 
+# Public chat endpoints skip CSRF (they should be protected by origin checks)
+_CSRF_SKIP = ("/chat_api", "/whatsapp")
+_CSRF_SKIP_LEN = max(map(len, _CSRF_SKIP))
+
+
 def install_csrf(app: Flask, settings: Settings) -> None:
-    SAFE = {"GET", "HEAD", "OPTIONS"}
+    SAFE = frozenset(("GET", "HEAD", "OPTIONS"))
     HEADER = "X-CSRF-Token"
+    # Expected token derived once; compared in constant time
+    expected = (getattr(settings, "SECRET_KEY", "") or "")[:16].encode()
 
     @app.before_request
     def _csrf():
         if request.method in SAFE:
             return
-        # Skip CSRF for public chat endpoints (they should be protected by origin checks)
-        path = (request.path or "").lower()
-        if path.startswith("/chat_api") or path.startswith("/whatsapp"):
+        # only the prefix matters; don't lowercase the whole path
+        if (request.path or "")[:_CSRF_SKIP_LEN].lower().startswith(_CSRF_SKIP):
             return
         token = request.headers.get(HEADER) or request.args.get("_csrf")
-        if not token or token != (getattr(settings, "SECRET_KEY", "")[:16]):
+        if not token or not hmac.compare_digest(token.encode(), expected):
             abort(403, description="csrf_failed")
 
 
+# Timing samples are buffered and handed to analytics off the request path.
+_TIMING_BUF_MAX = 10_000
+_TIMING_FLUSH_S = 1.0
+# Static assets and probe endpoints (routes/health_routes.py) aren't timed
+_TIMING_SKIP = ("/static/", "/favicon.ico", "/health", "/ready", "/version")
+
+
+class _TimingSink:
+    """One app's sample buffer and the analytics service it drains into."""
+
+    __slots__ = ("buf", "container", "__weakref__")
+
+    def __init__(self, container) -> None:
+        # bounded: if analytics falls behind, the oldest samples are dropped
+        self.buf: Deque[Tuple[str, int]] = deque(maxlen=_TIMING_BUF_MAX)
+        self.container = container
+
+    def drain(self) -> None:
+        # popleft is atomic, so requests can keep appending while we drain
+        buf = self.buf
+        batch = [buf.popleft() for _ in range(len(buf))]
+        if batch:
+            try:
+                self.container.analytics.record_timings_bulk(batch)
+            except Exception:
+                pass
+
+
+# One drainer thread per process serves every installed app; sinks are held
+# weakly so a discarded app's buffer goes away with it.
+_TIMING_SINKS: "weakref.WeakSet[_TimingSink]" = weakref.WeakSet()
+_TIMING_LOCK = threading.Lock()
+_TIMING_PID: Optional[int] = None  # process the drainer was started in
+_TIMING_STOP: Optional[threading.Event] = None
+
+
+def _drain_timings() -> None:
+    for sink in list(_TIMING_SINKS):
+        sink.drain()
+
+
+def _timing_loop(stop: threading.Event) -> None:
+    while not stop.wait(_TIMING_FLUSH_S):
+        _drain_timings()
+
+
+def _shutdown_timings() -> None:
+    if _TIMING_STOP is not None and _TIMING_PID == os.getpid():
+        _TIMING_STOP.set()
+    _drain_timings()
+
+
+def _ensure_timing_drainer() -> None:
+    """
+    Start the drainer on first use in each process. Threads don't survive
+    fork, so with gunicorn preload_app each worker starts its own.
+    """
+    global _TIMING_PID, _TIMING_STOP
+    pid = os.getpid()
+    if _TIMING_PID == pid:
+        return
+    with _TIMING_LOCK:
+        if _TIMING_PID == pid:
+            return
+        if _TIMING_PID is None:
+            # registered once; a forked child inherits the registration
+            atexit.register(_shutdown_timings)
+        _TIMING_STOP = threading.Event()
+        threading.Thread(
+            target=_timing_loop, args=(_TIMING_STOP,), name="timing-flush", daemon=True
+        ).start()
+        _TIMING_PID = pid
+
+
 def install_timing_metrics(app: Flask, container) -> None:
+    # the after_request closure keeps the sink alive for as long as the app
+    sink = _TimingSink(container)
+    _TIMING_SINKS.add(sink)
+
     @app.before_request
     def _start_timer():
-        g._t0 = time.time()
+        # no _t0 -> _stop_timer records nothing for this request
+        if not request.path.startswith(_TIMING_SKIP):
+            g._t0 = monotonic_ns()
 
     @app.after_request
     def _stop_timer(response):
-        try:
-            t0 = getattr(g, "_t0", None)
-            if t0 is not None:
-                dt = int((time.time() - t0) * 1000)
-                # minimal analytics ping
-                container.analytics.record_timing(path=request.path, ms=dt)
-        except Exception:
-            pass
+        t0 = getattr(g, "_t0", None)
+        if t0 is not None:
+            _ensure_timing_drainer()
+            sink.buf.append((request.path, (monotonic_ns() - t0) // 1_000_000))
         return response
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-import json
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from openai import OpenAI
+import json_codec as codec
+
+if TYPE_CHECKING:  # imported lazily in BrainV7.__init__ (slow cold import)
+    from openai import OpenAI
 
 
 DEFAULT_MODEL = "gpt-4.1-mini"
@@ -76,6 +79,72 @@ IMPORTANT:
 """
 
 
+# Plan returned for empty input or an unparseable model reply. Shared by every
+# fallback: never mutate it (or its "meta" dict) — copy via _fallback().
+_DEFAULT_PLAN: Dict[str, Any] = {
+    "intent": "unknown",
+    "action": "DO_NOTHING",
+    "category": None,
+    "product_name": None,
+    "postcode": None,
+    "sku": None,
+    "handoff_channel": None,
+    "needs_clarification": False,
+    "clarification_question": "",
+    "meta": {
+        "is_greeting": False,
+        "is_goodbye": False,
+    },
+}
+
+
+def _lower(v: Any) -> str:
+    return str(v).lower()
+
+
+# (field, coercer, keep_falsy) applied by _safe_parse_plan to model values.
+# Missing / None values keep the _DEFAULT_PLAN (or session) default; other
+# falsy values ("" / 0 / False) do too unless keep_falsy is set, in which case
+# the model's value is used as given.
+_PLAN_FIELDS = (
+    ("intent", str.strip, False),
+    ("action", str.strip, False),
+    ("category", _lower, True),
+    ("product_name", None, True),
+    ("postcode", None, False),
+    ("sku", None, False),
+    ("handoff_channel", None, True),
+    ("needs_clarification", bool, False),
+    ("clarification_question", None, False),
+)
+
+
+def _fallback(session: Dict[str, Any]) -> Dict[str, Any]:
+    # shallow copy; "meta" is the shared read-only dict from _DEFAULT_PLAN
+    return {**_DEFAULT_PLAN, "postcode": session.get("postcode"), "sku": session.get("last_sku")}
+
+
+# Messages that are *only* a greeting / goodbye ("salam!", "hi there", "bye")
+# are planned locally; anything with more content still goes to the model.
+_GREET_RE = re.compile(
+    r"^\s*(?:(?P<greet>hi+|hello|hey+|hiya|salaa?m|as?salaa?mu?\s*alaikum|"
+    r"good\s+(?:morning|afternoon|evening))|(?P<bye>bye+|goodbye|see\s+you))"
+    r"(?:\s+there)?[\s!.,?]*$",
+    re.I,
+)
+_GREET_META = {"is_greeting": True, "is_goodbye": False}  # read-only, shared
+_BYE_META = {"is_greeting": False, "is_goodbye": True}  # read-only, shared
+
+
+def _greeting_plan(m: "re.Match[str]", session: Dict[str, Any]) -> Dict[str, Any]:
+    plan = _fallback(session)
+    if m.group("greet"):
+        plan.update(intent="greeting", action="GREET", meta=_GREET_META)
+    else:
+        plan.update(intent="smalltalk", action="SMALLTALK_REPLY", meta=_BYE_META)
+    return plan
+
+
 @dataclass
 class BrainConfig:
     model: str = DEFAULT_MODEL
@@ -101,9 +170,16 @@ class BrainV7:
         )
     """
 
-    def __init__(self, client: Optional[OpenAI] = None, config: Optional[BrainConfig] = None):
-        self.client = client or OpenAI()
+    def __init__(self, client: Optional["OpenAI"] = None, config: Optional[BrainConfig] = None):
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI()
+        self.client = client
         self.config = config or BrainConfig()
+        # model and system prompt never change per call; resolve them once
+        self._model = self.config.model
+        self._sys_msg: Dict[str, str] = {"role": "system", "content": self.config.system_prompt}
 
     # ------------------------------------------------------------------
     # PUBLIC API
@@ -142,21 +218,12 @@ class BrainV7:
 
         if not user_text:
             # Hard guard: completely empty input
-            return {
-                "intent": "unknown",
-                "action": "DO_NOTHING",
-                "category": None,
-                "product_name": None,
-                "postcode": session.get("postcode"),
-                "sku": session.get("last_sku"),
-                "handoff_channel": None,
-                "needs_clarification": False,
-                "clarification_question": "",
-                "meta": {
-                    "is_greeting": False,
-                    "is_goodbye": False,
-                },
-            }
+            return _fallback(session)
+
+        m = _GREET_RE.match(user_text)
+        if m:
+            # Pure greeting / goodbye: no tools or slots needed, skip the LLM call
+            return _greeting_plan(m, session)
 
         payload = {
             "message": user_text,
@@ -170,13 +237,13 @@ class BrainV7:
         }
 
         messages: List[Dict[str, str]] = [
-            {"role": "system", "content": self.config.system_prompt},
+            self._sys_msg,
             *history,
-            {"role": "user", "content": json.dumps(payload)},
+            {"role": "user", "content": codec.dumps(payload).decode()},
         ]
 
         completion = self.client.chat.completions.create(
-            model=self.config.model,
+            model=self._model,
             response_format={"type": "json_object"},
             messages=messages,
         )
@@ -194,55 +261,29 @@ class BrainV7:
         Ensures all expected fields exist with sane defaults.
         """
         try:
-            data = json.loads(raw)
+            data = codec.loads(raw)
         except Exception:
             # Absolute fallback if the model misbehaves badly
-            return {
-                "intent": "unknown",
-                "action": "DO_NOTHING",
-                "category": None,
-                "product_name": None,
-                "postcode": session.get("postcode"),
-                "sku": session.get("last_sku"),
-                "handoff_channel": None,
-                "needs_clarification": False,
-                "clarification_question": "",
-                "meta": {
-                    "is_greeting": False,
-                    "is_goodbye": False,
-                },
+            return _fallback(session)
+
+        if not isinstance(data, dict):
+            return _fallback(session)
+
+        # Normalise fields in one pass: start from the fallback plan (which
+        # already carries the session postcode / sku) and overwrite each field
+        # the model filled in (see _PLAN_FIELDS for which falsy values count).
+        plan = _fallback(session)
+        get = data.get
+        for key, coerce, keep_falsy in _PLAN_FIELDS:
+            v = get(key)
+            if v is None or not (v or keep_falsy):
+                continue
+            plan[key] = coerce(v) if coerce else v
+
+        meta_in = get("meta")
+        if meta_in:
+            plan["meta"] = {
+                "is_greeting": bool(meta_in.get("is_greeting", False)),
+                "is_goodbye": bool(meta_in.get("is_goodbye", False)),
             }
-
-        # Normalise fields
-        intent = (data.get("intent") or "unknown").strip()
-        action = (data.get("action") or "DO_NOTHING").strip()
-
-        category = data.get("category")
-        if category is not None:
-            category = str(category).lower()
-        product_name = data.get("product_name")
-        postcode = data.get("postcode") or session.get("postcode")
-        sku = data.get("sku") or session.get("last_sku")
-        handoff_channel = data.get("handoff_channel")
-
-        needs_clarification = bool(data.get("needs_clarification", False))
-        clarification_question = data.get("clarification_question") or ""
-
-        meta_in = data.get("meta") or {}
-        meta = {
-            "is_greeting": bool(meta_in.get("is_greeting", False)),
-            "is_goodbye": bool(meta_in.get("is_goodbye", False)),
-        }
-
-        return {
-            "intent": intent,
-            "action": action,
-            "category": category,
-            "product_name": product_name,
-            "postcode": postcode,
-            "sku": sku,
-            "handoff_channel": handoff_channel,
-            "needs_clarification": needs_clarification,
-            "clarification_question": clarification_question,
-            "meta": meta,
-        }
+        return plan
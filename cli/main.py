@@ -19,12 +19,15 @@ Usage:
 
 from __future__ import annotations
 import argparse
+import functools
+import importlib
 import sys
 from pathlib import Path
 
 # Lazy imports so CLI loads fast and scripts remain optional at build time
+@functools.lru_cache(maxsize=None)
 def _m_import(mod: str):
-    return __import__(mod, fromlist=["*"])
+    return importlib.import_module(mod)
 
 
 def cmd_seed(args: argparse.Namespace) -> int:
@@ -67,6 +70,16 @@ def cmd_export_analytics(args: argparse.Namespace) -> int:
     return 0
 
 
+_DISPATCH = {
+    "seed": cmd_seed,
+    "snapshot": cmd_snapshot,
+    "restore": cmd_restore,
+    "validate": cmd_validate,
+    "synonyms": cmd_synonyms,
+    "export-analytics": cmd_export_analytics,
+}
+
+
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         prog="ai-sales-cli",
@@ -76,33 +89,27 @@ def build_parser() -> argparse.ArgumentParser:
 
     sp = sub.add_parser("seed", help="Generate example tenant data")
     sp.add_argument("--tenant", default="EXAMPLE")
-    sp.set_defaults(func=cmd_seed)
 
     sp = sub.add_parser("snapshot", help="Create snapshot tar.gz for a tenant")
     sp.add_argument("--tenant", required=True)
     sp.add_argument("--output", default=str(Path("backups")))
-    sp.set_defaults(func=cmd_snapshot)
 
     sp = sub.add_parser("restore", help="Restore from a snapshot")
     sp.add_argument("--tenant", required=True)
     sp.add_argument("--snapshot", required=True, help="Path to .tar.gz")
     sp.add_argument("--apply", action="store_true", help="Actually apply changes (otherwise dry-run)")
-    sp.set_defaults(func=cmd_restore)
 
     sp = sub.add_parser("validate", help="Validate tenant JSON against schemas")
     sp.add_argument("--tenant", required=True)
     sp.add_argument("--business-dir", default=str(Path("business")))
-    sp.set_defaults(func=cmd_validate)
 
     sp = sub.add_parser("synonyms", help="Rebuild synonym suggestions from logs")
     sp.add_argument("--tenant", required=True)
     sp.add_argument("--apply", action="store_true", help="Write suggestions into synonyms.json")
-    sp.set_defaults(func=cmd_synonyms)
 
     sp = sub.add_parser("export-analytics", help="Export analytics CSV")
     sp.add_argument("--tenant", required=False, help="Filter by tenant")
     sp.add_argument("--output", default=str(Path("analytics_export.csv")))
-    sp.set_defaults(func=cmd_export_analytics)
 
     return p
 
@@ -111,7 +118,7 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
     try:
-        return args.func(args)
+        return _DISPATCH[args.command](args)
     except KeyboardInterrupt:
         return 130
     except Exception as e:
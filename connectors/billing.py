@@ -19,35 +19,55 @@ Env (Paddle):
   PADDLE_API_BASE=https://api.paddle.com
 
 Notes:
-- We keep dependencies minimal (urllib + stdlib).
+- HTTP goes through the shared pooled session (connectors/http_pool.py).
 - Persistence of tenant status is left to services; we expose get/set and emit normalized events.
 """
 
 from __future__ import annotations
 import hmac
 import hashlib
-import json
 import os
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Tuple
-import urllib.parse
-import urllib.request
-import urllib.error
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+import json_codec as codec
+from json_codec import EMPTY
+from .http_pool import session
 
 
 JsonDict = Dict[str, Any]
 
+_SHA256 = hashlib.sha256
+
+# (status, event-type substrings), checked in order; first match wins
+_STATUS_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("active", ("invoice.paid", "payment_succeeded", "subscription_activated", "subscription.created")),
+    ("past_due", ("payment_failed", "invoice.payment_failed")),
+    ("canceled", ("subscription.canceled", "subscription_paused", "subscription.deleted", "subscription.cancelled")),
+)
 
-def _json_bytes(obj: Any) -> bytes:
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@lru_cache(maxsize=256)
+def _status_for_event(et: str) -> str:
+    """
+    Tenant status implied by a webhook event type ('' if none).
+    Provider event types are a small fixed set, so after the first webhook of
+    each type this is a single cache hit instead of a substring scan.
+    """
+    for status, keys in _STATUS_RULES:
+        if any(k in et for k in keys):
+            return status
+    return ""
 
 
 def _post(url: str, headers: Dict[str, str], body: Dict[str, Any], timeout: float = 10.0) -> JsonDict:
-    req = urllib.request.Request(url, data=_json_bytes(body), headers=headers, method="POST")
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read()
-        return json.loads(data.decode("utf-8"))
+    resp = session().post(url, data=codec.dumps(body), headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return codec.loads(resp.content)
 
 
 @dataclass
@@ -59,6 +79,14 @@ class BillingClient:
 
     # in-proc status cache; services/admin can persist
     _tenant_status: Dict[str, str] = field(default_factory=dict)
+    # webhook_secret encoded once for HMAC verification
+    _secret_bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+    # provider-specific webhook normalizer, bound once (None: unsupported provider)
+    _parse: Optional[Callable[[JsonDict], JsonDict]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._secret_bytes = self.webhook_secret.encode("utf-8") if self.webhook_secret else None
+        self._parse = {"stripe": self._parse_stripe, "paddle": self._parse_paddle}.get(self.provider)
 
     # ------------- factory -------------
 
@@ -140,42 +168,44 @@ class BillingClient:
         }
         """
         try:
-            payload = json.loads(body.decode("utf-8"))
+            payload = codec.loads(body)
         except Exception:
             return None
+        parse = self._parse
+        if parse is None or not isinstance(payload, dict):
+            return None
+        return parse(payload)
+
+    def _parse_stripe(self, payload: JsonDict) -> JsonDict:
+        get = payload.get
+        # malformed data/object/customer_details raise, as they always have
+        obj = get("data", EMPTY).get("object", EMPTY)
+        md = obj.get("metadata") or EMPTY
+        email = obj.get("customer_email") or obj.get("customer_details", EMPTY).get("email")
+        return {
+            "provider": "stripe",
+            "type": str(get("type") or ""),
+            "tenant": md.get("tenant") or md.get("business_key") or "",
+            "customer_email": email,
+            "raw": payload,
+        }
 
-        if self.provider == "stripe":
-            typ = payload.get("type") or ""
-            obj = payload.get("data", {}).get("object", {})
-            md = obj.get("metadata") or {}
-            return {
-                "provider": "stripe",
-                "type": str(typ),
-                "tenant": md.get("tenant") or md.get("business_key") or "",
-                "customer_email": obj.get("customer_email") or obj.get("customer_details", {}).get("email"),
-                "raw": payload,
-            }
-
-        if self.provider == "paddle":
-            # Paddle v2 style events: payload["event_type"], payload["data"]
-            typ = payload.get("event_type") or payload.get("type") or ""
-            data = payload.get("data") or payload
-            md = data.get("metadata") or {}
-            # Customer email: try data.customer.email or top-level "email"
-            email = None
-            cust = data.get("customer") or {}
-            if isinstance(cust, dict):
-                email = cust.get("email")
-            email = email or data.get("email")
-            return {
-                "provider": "paddle",
-                "type": str(typ),
-                "tenant": md.get("tenant") or md.get("business_key") or "",
-                "customer_email": email,
-                "raw": payload,
-            }
-
-        return None
+    def _parse_paddle(self, payload: JsonDict) -> JsonDict:
+        # Paddle v2 style events: payload["event_type"], payload["data"]
+        get = payload.get
+        typ = get("event_type") or get("type") or ""
+        data = get("data") or payload
+        md = data.get("metadata") or EMPTY
+        # Customer email: try data.customer.email or top-level "email"
+        cust = data.get("customer")
+        email = cust.get("email") if isinstance(cust, dict) else None
+        return {
+            "provider": "paddle",
+            "type": str(typ),
+            "tenant": md.get("tenant") or md.get("business_key") or "",
+            "customer_email": email or data.get("email"),
+            "raw": payload,
+        }
 
     def handle_webhook(self, headers: Dict[str, str], body: bytes) -> Tuple[bool, Optional[JsonDict]]:
         """
@@ -192,12 +222,9 @@ class BillingClient:
         et = evt.get("type", "")
 
         # naive mapping for status cache
-        if any(k in et for k in ("invoice.paid", "payment_succeeded", "subscription_activated", "subscription.created")):
-            self.set_tenant_status(tenant, "active")
-        elif any(k in et for k in ("payment_failed", "invoice.payment_failed")):
-            self.set_tenant_status(tenant, "past_due")
-        elif any(k in et for k in ("subscription.canceled", "subscription_paused", "subscription.deleted", "subscription.cancelled")):
-            self.set_tenant_status(tenant, "canceled")
+        status = _status_for_event(et)
+        if status:
+            self.set_tenant_status(tenant, status)
 
         return True, evt
 
@@ -241,23 +268,22 @@ class BillingClient:
             "line_items[0][quantity]": "1",
             "metadata[tenant]": tenant,
         }
-        encoded = urllib.parse.urlencode(data).encode("utf-8")
-        req = urllib.request.Request(
+        resp = session().post(
             url,
-            data=encoded,
+            data=data,  # requests form-encodes dicts
             headers={"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/x-www-form-urlencoded"},
-            method="POST",
+            timeout=12,
         )
-        with urllib.request.urlopen(req, timeout=12) as resp:
-            out = json.loads(resp.read().decode("utf-8"))
-            return {"id": out.get("id"), "url": out.get("url")}
+        resp.raise_for_status()
+        out = codec.loads(resp.content)
+        return {"id": out.get("id"), "url": out.get("url")}
 
     def _verify_stripe(self, signature_header: str, body: bytes) -> bool:
         """
         Stripe signature: t=timestamp, v1=HMAC_SHA256(secret, "{t}.{payload}")
         We implement the common v1 case. If header missing, accept only if secret not set.
         """
-        secret = self.webhook_secret
+        secret = self._secret_bytes
         if not secret:
             return True
         try:
@@ -266,12 +292,16 @@ class BillingClient:
             v1 = parts.get("v1")
             if not ts or not v1:
                 return False
-            signed = f"{ts}.{body.decode('utf-8')}".encode("utf-8")
-            digest = hmac.new(secret.encode("utf-8"), signed, hashlib.sha256).hexdigest()
+            # sign "{t}.{payload}" over the raw body bytes; no decode/re-encode
+            mac = hmac.new(secret, ts.encode("ascii"), _SHA256)
+            mac.update(b".")
+            mac.update(body)
+            digest = mac.digest()
             # optional: reject stale timestamps (e.g., >5 minutes)
             if abs(time.time() - float(ts)) > 300:
                 return False
-            return hmac.compare_digest(digest, v1)
+            # raw 32-byte compare; malformed hex raises -> False
+            return hmac.compare_digest(digest, bytes.fromhex(v1))
         except Exception:
             return False
 
@@ -306,19 +336,20 @@ class BillingClient:
         try:
             out = _post(url, headers, body)
             return {"id": out.get("id") or out.get("checkout_id"), "url": out.get("url") or out.get("checkout_url")}
-        except urllib.error.HTTPError as e:
-            raise RuntimeError(f"Paddle checkout failed: {e.code}") from e
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else "?"
+            raise RuntimeError(f"Paddle checkout failed: {status}") from e
 
     def _verify_paddle(self, signature_header: str, body: bytes) -> bool:
         """
         Simple HMAC verification. Some Paddle setups sign the raw body (or a timestamp + body).
         Here we support raw-body HMAC-SHA256 with shared secret.
         """
-        secret = self.webhook_secret
+        secret = self._secret_bytes
         if not secret:
             return True
         try:
-            expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
-            return hmac.compare_digest(expected, signature_header)
+            expected = hmac.new(secret, body, _SHA256).digest()
+            return hmac.compare_digest(expected, bytes.fromhex(signature_header))
         except Exception:
             return False
@@ -12,14 +12,40 @@ Usage:
 
 from __future__ import annotations
 import os
+import queue
 import smtplib
 import ssl
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from email.message import EmailMessage
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import json
-import urllib.request
+
+import json_codec as codec
+from .http_pool import session
+
+# Warm SMTP sessions kept per Emailer, and how long one may sit idle before
+# it is discarded instead of reused (servers drop idle clients after minutes).
+_SMTP_POOL_SIZE = 4
+_SMTP_IDLE_S = 60.0
+
+_TLS_CONTEXT: Optional[ssl.SSLContext] = None
+
+
+def _tls_context() -> ssl.SSLContext:
+    # create_default_context() loads the CA bundle; do it once per process
+    global _TLS_CONTEXT
+    if _TLS_CONTEXT is None:
+        _TLS_CONTEXT = ssl.create_default_context()
+    return _TLS_CONTEXT
+
+
+def _smtp_close(server: smtplib.SMTP) -> None:
+    try:
+        server.quit()
+    except Exception:
+        server.close()
 
 
 @dataclass
@@ -39,6 +65,12 @@ class Emailer:
     api_url: Optional[str] = None
     api_key: Optional[str] = None
     api_from: Optional[str] = None
+    api_max_bytes: int = 5 * 1024 * 1024  # refuse larger JSON bodies up front
+
+    # warm SMTP sessions (EHLO/STARTTLS/login done), most recently used first
+    _smtp_pool: "queue.LifoQueue[Tuple[smtplib.SMTP, float]]" = field(
+        default_factory=lambda: queue.LifoQueue(maxsize=_SMTP_POOL_SIZE), init=False, repr=False
+    )
 
     @classmethod
     def from_env(cls, *, force_smtp: bool | None = None) -> "Emailer":
@@ -85,7 +117,8 @@ class Emailer:
     # -------- backends --------
 
     def _send_smtp(self, to: str, *, subject: str, text: str, html: Optional[str]) -> bool:
-        if not self.smtp_host:
+        host = self.smtp_host
+        if not host:
             raise RuntimeError("SMTP_HOST not configured")
         msg = EmailMessage()
         msg["From"] = self.smtp_from or "no-reply@example.com"
@@ -97,16 +130,58 @@ class Emailer:
         else:
             msg.set_content(text or "")
 
-        context = ssl.create_default_context()
-        with smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=10) as server:
+        while True:
+            server, reused = self._smtp_checkout(host)
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                _smtp_close(server)
+                if reused:
+                    continue  # stale pooled session: try the next one
+                raise
+            except Exception:
+                _smtp_close(server)  # session state unknown; don't pool it
+                raise
+            try:
+                self._smtp_pool.put_nowait((server, time.monotonic()))
+            except queue.Full:
+                _smtp_close(server)
+            return True
+
+    def _smtp_checkout(self, host: str) -> Tuple[smtplib.SMTP, bool]:
+        """A warm pooled session if one is fresh enough, else a new one."""
+        now = time.monotonic()
+        while True:
+            try:
+                server, used = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return self._smtp_connect(host), False
+            if now - used <= _SMTP_IDLE_S:
+                return server, True
+            _smtp_close(server)
+
+    def _smtp_connect(self, host: str) -> smtplib.SMTP:
+        server = smtplib.SMTP(host, self.smtp_port, timeout=10)
+        try:
             server.ehlo()
             if self.smtp_tls:
-                server.starttls(context=context)
+                server.starttls(context=_tls_context())
                 server.ehlo()
             if self.smtp_user and self.smtp_pass:
                 server.login(self.smtp_user, self.smtp_pass)
-            server.send_message(msg)
-        return True
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def close(self) -> None:
+        """Close all pooled SMTP sessions."""
+        while True:
+            try:
+                server, _ = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return
+            _smtp_close(server)
 
     def _send_http(self, to: str, *, subject: str, text: str, html: Optional[str]) -> bool:
         if not self.api_url or not self.api_key:
@@ -120,13 +195,15 @@ class Emailer:
         if html:
             payload["html"] = html
 
-        req = urllib.request.Request(
+        body = codec.dumps(payload)  # one pass straight to UTF-8 bytes
+        if len(body) > self.api_max_bytes:
+            raise RuntimeError(f"Mail API payload too large ({len(body)} > {self.api_max_bytes} bytes)")
+        resp = session().post(
             self.api_url,
-            data=json.dumps(payload).encode("utf-8"),
+            data=body,
             headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"},
-            method="POST",
+            timeout=10,
         )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            if 200 <= resp.status < 300:
-                return True
-            raise RuntimeError(f"Mail API returned {resp.status}")
+        if 200 <= resp.status_code < 300:
+            return True
+        raise RuntimeError(f"Mail API returned {resp.status_code}")
@@ -0,0 +1,44 @@
+"""
+Shared HTTP session for connectors.
+
+One process-wide requests.Session with pooled keep-alive connections, so
+repeated calls to the same host (Stripe, Sheets, Maps, mail API) reuse the
+TCP+TLS connection instead of handshaking per request.
+
+- Built lazily on first use (importing a connector stays cheap)
+- No adapter-level retries: each connector keeps its own retry/backoff policy
+- Callers always pass an explicit timeout
+"""
+
+from __future__ import annotations
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+POOL_CONNECTIONS = 16  # distinct hosts kept pooled
+POOL_MAXSIZE = 64  # keep-alive connections per host
+
+_SESSION: Optional[requests.Session] = None
+_LOCK = threading.Lock()
+
+
+def session() -> requests.Session:
+    """Return the shared pooled session (created on first call)."""
+    global _SESSION
+    s = _SESSION
+    if s is None:
+        with _LOCK:
+            s = _SESSION
+            if s is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=0,
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _SESSION = s
+    return s
@@ -3,7 +3,7 @@ Maps/Geocoding connector.
 
 Goals:
 - Provide an optional postcode -> (lat, lon) lookup for GeoStore.nearest_for_postcode().
-- Cache results to avoid repeated external calls.
+- Cache results to avoid repeated external calls (TTL + LRU size bound).
 - Keep backend pluggable (HTTP API, local table, etc.).
 
 Env (optional):
@@ -13,39 +13,54 @@ fallback to outward-prefix branch matching.
 """
 
 from __future__ import annotations
-import json
 import os
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional, Tuple
-from urllib.parse import urlencode
-import urllib.request
+from urllib.parse import quote_plus
+
+import json_codec as codec
+from .http_pool import session
 
 GeoPoint = Tuple[float, float]
 Backend = Callable[[str], Optional[GeoPoint]]
 
 
+@lru_cache(maxsize=4096)
 def _norm_postcode(pc: str) -> str:
     return (pc or "").upper().replace(" ", "").strip()
 
 
 @dataclass
 class _TTLCache:
+    """TTL cache bounded to maxsize entries (least recently used evicted first)."""
+
     ttl: int
-    data: Dict[str, Any] = field(default_factory=dict)
-    exp: Dict[str, float] = field(default_factory=dict)
+    maxsize: int = 100_000
+    # key -> (value, expires_at); order is recency, oldest first
+    od: "OrderedDict[str, Tuple[Any, float]]" = field(default_factory=OrderedDict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
     def get(self, k: str) -> Any:
-        now = time.time()
-        if k in self.data and self.exp.get(k, 0) > now:
-            return self.data[k]
-        self.data.pop(k, None)
-        self.exp.pop(k, None)
-        return None
+        with self._lock:
+            hit = self.od.get(k)
+            if hit is None:
+                return None
+            if hit[1] > time.monotonic():
+                self.od.move_to_end(k)
+                return hit[0]
+            del self.od[k]
+            return None
 
     def set(self, k: str, v: Any) -> None:
-        self.data[k] = v
-        self.exp[k] = time.time() + self.ttl
+        with self._lock:
+            self.od[k] = (v, time.monotonic() + self.ttl)
+            self.od.move_to_end(k)
+            while len(self.od) > self.maxsize:
+                self.od.popitem(last=False)
 
 
 @dataclass
@@ -71,22 +86,21 @@ class MapsClient:
         Generic HTTP backend; expects JSON {lat: float, lon: float} or {latitude, longitude}
         GET {base_url}?q={postcode}&key={api_key}
         """
+        # only q varies per call; the rest of the URL is built once
+        prefix = f"{base_url}?q="
+        suffix = f"&key={quote_plus(api_key)}" if api_key else ""
+
         def _call(postcode: str) -> Optional[GeoPoint]:
             q = _norm_postcode(postcode)
             if not q:
                 return None
-            params = {"q": q}
-            if api_key:
-                params["key"] = api_key
-            url = f"{base_url}?{urlencode(params)}"
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=6) as resp:
-                if 200 <= resp.status < 300:
-                    data = json.loads(resp.read().decode("utf-8"))
-                    lat = data.get("lat") or data.get("latitude")
-                    lon = data.get("lon") or data.get("longitude")
-                    if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                        return (float(lat), float(lon))
+            resp = session().get(prefix + quote_plus(q) + suffix, timeout=6)
+            if 200 <= resp.status_code < 300:
+                data = codec.loads(resp.content)
+                lat = data.get("lat") or data.get("latitude")
+                lon = data.get("lon") or data.get("longitude")
+                if isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
+                    return (float(lat), float(lon))
             return None
         return _call
 
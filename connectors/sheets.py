@@ -2,10 +2,10 @@
 Google Sheets connector.
 
 Responsibilities:
-- Append analytics events
+- Append analytics events (buffered; one values:append call per batch)
 - Read/write catalog exports
 - Respect rate limits & exponential backoff
-- Minimal dependencies (urllib only)
+- HTTP via the shared pooled session (connectors/http_pool.py)
 - Optional usage: if creds not set, calls are no-ops
 
 Env:
@@ -16,18 +16,24 @@ Env:
 """
 
 from __future__ import annotations
-import json
 import os
+import atexit
+import logging
 import random
+import threading
 import time
-import urllib.error
-import urllib.request
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, DefaultDict, Deque, Dict, List, Optional
 
+import json_codec as codec
+from .http_pool import session
 
-def _json(obj: Any) -> bytes:
-    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+logger = logging.getLogger("SheetsConnector")
+
+# timeouts, throttling and transient upstream failures are retried
+_RETRY_STATUS = frozenset((408, 429, 500, 502, 503, 504))
 
 
 @dataclass
@@ -38,6 +44,21 @@ class SheetsClient:
     export_sheet: Optional[str] = None
     max_retries: int = 3
     backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    # append_event buffering: a background thread sends up to batch_size rows
+    # per request every flush_interval_s (sooner once a batch is full)
+    batch_size: int = 200
+    flush_interval_s: float = 1.0
+    max_buffer: int = 10_000  # oldest rows are dropped beyond this
+    export_chunk_rows: int = 1_000  # rows per export_catalog request
+
+    _rng: random.Random = field(default_factory=random.Random, init=False, repr=False)
+    _buf: Deque[List[Any]] = field(default_factory=deque, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _send_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _wake: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _stop: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _flusher: Optional[threading.Thread] = field(default=None, init=False, repr=False)
 
     # -------- factory --------
     @classmethod
@@ -51,70 +72,152 @@ class SheetsClient:
 
     # -------- internal HTTP helper --------
     def _req(self, url: str, payload: Dict[str, Any]) -> bool:
-        data = _json(payload)
+        data = codec.dumps(payload)
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+        http = session()
+        # decorrelated jitter: each wait is drawn from [base, 3 * previous wait]
+        base, cap, uniform = self.backoff_base, self.backoff_cap, self._rng.uniform
+        delay = base
         for attempt in range(1, self.max_retries + 1):
             try:
-                req = urllib.request.Request(
-                    url,
-                    data=data,
-                    headers={
-                        "Content-Type": "application/json",
-                        "Authorization": f"Bearer {self.api_key}",
-                    },
-                    method="POST",
-                )
-                with urllib.request.urlopen(req, timeout=8) as r:
-                    if 200 <= r.status < 300:
-                        return True
-            except urllib.error.HTTPError as e:
-                if e.code in (429, 500, 503):
-                    delay = self.backoff_base * (2 ** (attempt - 1)) + random.random() * 0.2
-                    time.sleep(delay)
-                    continue
-                raise
+                r = http.post(url, data=data, headers=headers, timeout=8)
             except Exception:
-                delay = self.backoff_base * (2 ** (attempt - 1))
+                pass
+            else:
+                if 200 <= r.status_code < 300:
+                    return True
+                if r.status_code not in _RETRY_STATUS:
+                    r.raise_for_status()
+            if attempt < self.max_retries:  # no pointless sleep after the last try
+                delay = min(cap, uniform(base, delay * 3))
                 time.sleep(delay)
         return False
 
+    # -------- event batching --------
+    def _start_flusher(self) -> None:
+        # caller holds self._lock
+        self._flusher = threading.Thread(target=self._flush_loop, name="sheets-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_s)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # keep the thread alive; the next tick retries what's buffered
+                logger.exception("sheets flush failed")
+
+    def flush(self) -> bool:
+        """
+        Send buffered event rows now, batch_size rows per request.
+        Returns False if a batch could not be delivered; transient failures
+        are re-queued for the next flush, rejected batches (4xx) are dropped.
+        """
+        url = f"{self.api_url}/{self.analytics_sheet}/values/Events:append?valueInputOption=RAW"
+        ok = True
+        with self._send_lock:  # one sender at a time keeps rows in order
+            while True:
+                with self._lock:
+                    n = min(self.batch_size, len(self._buf))
+                    rows = [self._buf.popleft() for _ in range(n)]
+                if not rows:
+                    return ok
+                # event column is serialized here, off the caller's thread
+                # (re-queued rows are already strings); a row that can't be
+                # encoded is dropped on its own, not with its whole batch
+                rows = [row for row in rows if self._encode_row(row)]
+                if not rows:
+                    continue
+                try:
+                    sent = self._req(url, {"values": rows})
+                except Exception:
+                    ok = False
+                    continue
+                if not sent:
+                    with self._lock:
+                        room = self.max_buffer - len(self._buf)
+                        if room > 0:
+                            self._buf.extendleft(reversed(rows[:room]))
+                    return False
+
+    @staticmethod
+    def _encode_row(row: List[Any]) -> bool:
+        ev = row[3]
+        if type(ev) is str:
+            return True
+        try:
+            row[3] = codec.dumps(ev).decode("utf-8")
+        except Exception:
+            logger.warning("dropping unserializable event row (tenant=%s type=%s)", row[1], row[2])
+            return False
+        return True
+
+    def close(self) -> None:
+        """Stop the background flusher and send whatever is still buffered."""
+        self._stop.set()
+        self._wake.set()
+        t = self._flusher
+        if t is not None and t is not threading.current_thread():
+            t.join(timeout=self.flush_interval_s + 10)
+        self.flush()
+
     # -------- public API --------
     def append_event(self, tenant: str, event: Dict[str, Any]) -> bool:
         """
-        Append one analytics event row.
+        Queue one analytics event row; it is sent with the next batch.
+        The event is JSON-encoded at flush time, so don't mutate it afterwards.
+        Returns False if the client is not configured or has been closed.
         """
-        if not (self.api_url and self.api_key and self.analytics_sheet):
+        if not (self.api_url and self.api_key and self.analytics_sheet) or self._stop.is_set():
             return False
-        url = f"{self.api_url}/{self.analytics_sheet}/values/Events:append?valueInputOption=RAW"
         row = [
             time.strftime("%Y-%m-%d %H:%M:%S"),
             tenant,
             event.get("type"),
-            json.dumps(event, ensure_ascii=False),
+            event,
         ]
-        payload = {"values": [row]}
-        return self._req(url, payload)
+        with self._lock:
+            if len(self._buf) >= self.max_buffer:
+                self._buf.popleft()
+            self._buf.append(row)
+            full = len(self._buf) >= self.batch_size
+            if self._flusher is None:
+                self._start_flusher()
+        if full:
+            self._wake.set()
+        return True
 
     def export_catalog(self, tenant: str, catalog: Dict[str, Any]) -> bool:
         """
-        Upload entire catalog (flattened) into export sheet.
+        Upload entire catalog (flattened) into export sheet, export_chunk_rows
+        rows per request. True only if every chunk was accepted.
         """
         if not (self.api_url and self.api_key and self.export_sheet):
             return False
-        rows: List[List[Any]] = []
-        for cat in catalog.get("categories", []):
-            cname = cat.get("name")
-            for item in (cat.get("items") or []):
-                rows.append([
-                    tenant,
-                    cname,
-                    item.get("name"),
-                    item.get("price"),
-                    "Y" if item.get("in_stock") else "N",
-                    ",".join(item.get("tags") or []),
-                ])
-        payload = {"values": rows}
+        sep = ",".join
+        rows: List[List[Any]] = [
+            [
+                tenant,
+                cname,
+                item.get("name"),
+                item.get("price"),
+                "Y" if item.get("in_stock") else "N",
+                sep(item.get("tags") or []),
+            ]
+            for cat in catalog.get("categories", [])
+            for cname in (cat.get("name"),)
+            for item in (cat.get("items") or [])
+        ]
         url = f"{self.api_url}/{self.export_sheet}/values/Catalog:append?valueInputOption=RAW"
-        return self._req(url, payload)
+        # chunked so large catalogs stay well under the request size limit
+        step = self.export_chunk_rows
+        return all(self._req(url, {"values": rows[i:i + step]}) for i in range(0, len(rows), step))
 
     def import_catalog(self, tenant: str) -> Optional[Dict[str, Any]]:
         """
@@ -125,24 +228,23 @@ class SheetsClient:
             return None
         try:
             url = f"{self.api_url}/{self.export_sheet}/values/Catalog?majorDimension=ROWS"
-            req = urllib.request.Request(url, headers={"Authorization": f"Bearer {self.api_key}"})
-            with urllib.request.urlopen(req, timeout=10) as r:
-                data = json.loads(r.read().decode("utf-8"))
-            values = data.get("values", [])[1:]  # skip header
+            r = session().get(url, headers={"Authorization": f"Bearer {self.api_key}"}, timeout=10)
+            r.raise_for_status()
+            data = codec.loads(r.content)  # bytes in, no separate decode pass
             catalog: Dict[str, Any] = {"version": 1, "categories": []}
-            by_cat: Dict[str, List[Dict[str, Any]]] = {}
-            for row in values:
+            by_cat: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+            strip = str.strip
+            for row in islice(data.get("values", []), 1, None):  # skip header
                 if len(row) < 6:
                     continue
-                _, cat, name, price, stock, tags = row
-                by_cat.setdefault(cat, []).append({
-                    "name": name,
-                    "price": float(price or 0),
-                    "in_stock": stock.upper().startswith("Y"),
-                    "tags": [t.strip() for t in tags.split(",") if t.strip()],
+                tags = row[5]
+                by_cat[row[1]].append({
+                    "name": row[2],
+                    "price": float(row[3] or 0),
+                    "in_stock": row[4].upper().startswith("Y"),
+                    "tags": [t for t in map(strip, tags.split(",")) if t],
                 })
-            for cname, items in by_cat.items():
-                catalog["categories"].append({"name": cname, "items": items})
+            catalog["categories"] = [{"name": cname, "items": items} for cname, items in by_cat.items()]
             return catalog
         except Exception:
             return None
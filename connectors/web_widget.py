@@ -32,7 +32,8 @@ Contract (outgoing to client):
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
@@ -45,7 +46,12 @@ DEFAULT_ALLOWED_ORIGINS: List[str] = [
     "http://127.0.0.1",
 ]
 
+# Typing indicators fire in bursts; build both events once
+_TYPING_ON: Dict[str, Any] = {"__asa": EVT_FROM_IFRAME, "payload": {"type": "chat:typing", "data": {"on": True}}}
+_TYPING_OFF: Dict[str, Any] = {"__asa": EVT_FROM_IFRAME, "payload": {"type": "chat:typing", "data": {"on": False}}}
 
+
+@lru_cache(maxsize=4096)
 def _canon_origin(u: str) -> str:
     try:
         p = urlparse(u)
@@ -68,14 +74,20 @@ class WidgetBridge:
 
     allowed_origins: Optional[List[str]] = None
 
+    def __post_init__(self) -> None:
+        # compiled allowlist: exact hit is one hash lookup, otherwise a single
+        # startswith over all prefixes (same matching as before)
+        allowed = self.allowed_origins or DEFAULT_ALLOWED_ORIGINS
+        self._exact: FrozenSet[str] = frozenset(allowed)
+        self._prefixes: Tuple[str, ...] = tuple(allowed)
+
     # ---- validation ----
 
     def validate_origin(self, origin: str) -> bool:
         if not origin:
             return False
-        allowed = self.allowed_origins or DEFAULT_ALLOWED_ORIGINS
         o = _canon_origin(origin)
-        return any(o.startswith(a) for a in allowed)
+        return o in self._exact or o.startswith(self._prefixes)
 
     def is_chat_message(self, payload: Dict[str, Any]) -> bool:
         if not isinstance(payload, dict):
@@ -108,14 +120,15 @@ class WidgetBridge:
         return {"__asa": EVT_FROM_IFRAME, "payload": {"type": "ready", "data": data or {}}}
 
     def build_typing_event(self, on: bool = True) -> Dict[str, Any]:
-        return {"__asa": EVT_FROM_IFRAME, "payload": {"type": "chat:typing", "data": {"on": bool(on)}}}
+        # shallow copy of a prebuilt event; the nested payload is shared (read-only)
+        return dict(_TYPING_ON if on else _TYPING_OFF)
 
     def build_reply_event(self, reply: str, raw: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         return {
             "__asa": EVT_FROM_IFRAME,
             "payload": {
                 "type": "chat:reply",
-                "data": {"reply": str(reply or ""), "raw": raw or {}},
+                "data": {"reply": reply if type(reply) is str else str(reply or ""), "raw": raw or {}},
             },
         }
 
@@ -8,18 +8,40 @@ Supports:
 Provides:
 - parse_inbound(payload) -> list[dict]
 - send_reply(event, reply, settings) -> None  (Cloud API only)
+- send_reply_async(event, reply, settings) -> None  (same, off the caller's thread)
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 import logging
-import requests
+import threading
 
 from app.config import Settings
+import json_codec as codec
+from json_codec import EMPTY
+from .http_pool import session
 
 logger = logging.getLogger("WhatsAppConnector")
 
+# Twilio prefixes WhatsApp addresses in From/To
+_WA_PREFIX = "whatsapp:"
+
+# Outbound Cloud API sends run on a small set of sender lanes so webhook
+# threads don't wait on graph.facebook.com. Each lane is one thread and a
+# recipient always maps to the same lane, so one number's replies go out in
+# order. At most _SEND_MAX_PENDING sends are queued or in flight; past that
+# the caller waits for its lane, which applies backpressure.
+_SEND_WORKERS = 8
+_SEND_MAX_PENDING = 75
+_SEND_SLOTS = threading.BoundedSemaphore(_SEND_MAX_PENDING)
+_LANES: Optional[List[ThreadPoolExecutor]] = None
+_LANES_LOCK = threading.Lock()
+
+_DEFAULT_API_URL = "https://graph.facebook.com/v21.0"
+
 
 def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -49,16 +71,14 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
 
     # -------- Twilio form-encoded (wrapped as "raw_form") ----------
     if "raw_form" in payload:
-        form = payload.get("raw_form") or {}
-        body = (form.get("Body") or "").strip()
+        form = payload.get("raw_form") or EMPTY
+        get = form.get
+        body = (get("Body") or "").strip()
 
         # Twilio WA sends both WaId and From (with "whatsapp:" prefix)
-        wa_id = (form.get("WaId") or "").strip()
+        wa_id = (get("WaId") or "").strip()
         if not wa_id:
-            frm = (form.get("From") or "").strip()
-            if frm.startswith("whatsapp:"):
-                frm = frm[len("whatsapp:") :]
-            wa_id = frm
+            wa_id = (get("From") or "").strip().removeprefix(_WA_PREFIX)
 
         if body and wa_id:
             events.append(
@@ -69,8 +89,8 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
                     "text": body,
                     "raw": form,
                     "metadata": {
-                        "twilio_message_sid": form.get("MessageSid"),
-                        "profile_name": form.get("ProfileName"),
+                        "twilio_message_sid": get("MessageSid"),
+                        "profile_name": get("ProfileName"),
                     },
                     "source": "twilio",
                 }
@@ -78,17 +98,22 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         else:
             logger.debug(
                 "parse_inbound(Twilio): missing wa_id/body; form=%r",
-                {k: form.get(k) for k in ["From", "WaId", "Body"]},
+                {k: get(k) for k in ("From", "WaId", "Body")},
             )
 
         return events
 
     # -------- Meta Cloud API JSON ----------
-    for entry in payload.get("entry", []):
-        for change in entry.get("changes", []):
-            value = change.get("value", {}) or {}
-            metadata = value.get("metadata", {}) or {}
-            messages = value.get("messages", []) or []
+    for entry in payload.get("entry", ()):
+        for change in entry.get("changes", ()):
+            value = change.get("value") or EMPTY
+            messages = value.get("messages")
+            if not messages:
+                # statuses/read receipts: no metadata lookups needed
+                continue
+            metadata = value.get("metadata") or EMPTY
+            phone_number_id = metadata.get("phone_number_id")
+            display_phone_number = metadata.get("display_phone_number")
 
             for msg in messages:
                 # Only handle text messages for now
@@ -96,7 +121,7 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
                     continue
 
                 wa_id = msg.get("from")
-                text = (msg.get("text", {}) or {}).get("body", "") or ""
+                text = (msg.get("text") or EMPTY).get("body") or ""
 
                 if not wa_id or not text.strip():
                     continue
@@ -109,10 +134,8 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
                         "text": text,
                         "raw": msg,
                         "metadata": {
-                            "phone_number_id": metadata.get("phone_number_id"),
-                            "display_phone_number": metadata.get(
-                                "display_phone_number"
-                            ),
+                            "phone_number_id": phone_number_id,
+                            "display_phone_number": display_phone_number,
                         },
                         "source": "cloud",
                     }
@@ -124,6 +147,20 @@ def parse_inbound(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     return events
 
 
+@lru_cache(maxsize=16)
+def _endpoint(base_url: str, phone_id: str, token: str) -> Tuple[str, Dict[str, str]]:
+    """Messages URL and request headers for one Cloud API config (built once).
+
+    The headers dict is shared between calls; requests copies it, never mutates it.
+    """
+    url = f"{base_url.rstrip('/')}/{phone_id}/messages"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+    return url, headers
+
+
 def send_reply(event: Dict[str, Any], reply: str, *, settings: Settings) -> None:
     """
     Send a text reply back via WhatsApp Cloud API.
@@ -147,7 +184,7 @@ def send_reply(event: Dict[str, Any], reply: str, *, settings: Settings) -> None
 
     token = settings.WHATSAPP_TOKEN
     phone_id = settings.WHATSAPP_PHONE_ID
-    base_url = settings.WHATSAPP_API_URL or "https://graph.facebook.com/v21.0"
+    base_url = settings.WHATSAPP_API_URL or _DEFAULT_API_URL
 
     if not token or not phone_id:
         logger.warning(
@@ -156,13 +193,7 @@ def send_reply(event: Dict[str, Any], reply: str, *, settings: Settings) -> None
         )
         return
 
-    url = f"{base_url.rstrip('/')}/{phone_id}/messages"
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-
+    url, headers = _endpoint(base_url, phone_id, token)
     payload: Dict[str, Any] = {
         "messaging_product": "whatsapp",
         "to": wa_id,
@@ -171,7 +202,7 @@ def send_reply(event: Dict[str, Any], reply: str, *, settings: Settings) -> None
     }
 
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=8)
+        resp = session().post(url, headers=headers, data=codec.dumps(payload), timeout=8)
         if resp.status_code >= 400:
             logger.warning(
                 "send_reply: WA Cloud API returned non-2xx",
@@ -186,3 +217,50 @@ def send_reply(event: Dict[str, Any], reply: str, *, settings: Settings) -> None
             "send_reply: exception while calling WA Cloud API",
             extra={"wa_id": wa_id, "error": str(exc)},
         )
+
+
+def _lane(wa_id: str) -> ThreadPoolExecutor:
+    # Built lazily so gunicorn's preload_app doesn't fork a parent's threads
+    global _LANES
+    lanes = _LANES
+    if lanes is None:
+        with _LANES_LOCK:
+            lanes = _LANES
+            if lanes is None:
+                lanes = _LANES = [
+                    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"wa-send-{i}")
+                    for i in range(_SEND_WORKERS)
+                ]
+    return lanes[hash(wa_id) % _SEND_WORKERS]
+
+
+def _send_and_release(event: Dict[str, Any], reply: str, settings: Settings) -> None:
+    try:
+        send_reply(event, reply, settings=settings)
+    except Exception:
+        logger.exception("send_reply_async: send failed", extra={"wa_id": event.get("from")})
+    finally:
+        _SEND_SLOTS.release()
+
+
+def send_reply_async(event: Dict[str, Any], reply: str, *, settings: Settings) -> None:
+    """
+    Like send_reply, but hands the HTTP call to the recipient's sender lane
+    and returns immediately. When the lanes are full it waits for the send
+    instead, still on the lane so it can't overtake earlier replies.
+    """
+    if event.get("source") == "twilio":
+        return
+    lane = _lane(str(event.get("from") or ""))
+    try:
+        if _SEND_SLOTS.acquire(blocking=False):
+            try:
+                lane.submit(_send_and_release, event, reply, settings)
+            except RuntimeError:
+                _SEND_SLOTS.release()
+                raise
+            return
+        lane.submit(send_reply, event, reply, settings=settings).result()
+    except RuntimeError:
+        # lane already shut down (interpreter exiting)
+        send_reply(event, reply, settings=settings)
@@ -4,7 +4,11 @@ import os
 # Bind / workers / threads
 bind = os.getenv("BIND", "0.0.0.0:10000")
 workers = int(os.getenv("WEB_CONCURRENCY", str(max(2, multiprocessing.cpu_count() // 2))))
-threads = int(os.getenv("WEB_THREADS", "2"))
+# Webhook requests mostly wait on sockets (OpenAI, Meta), so threads, not
+# processes, carry the concurrency
+threads = int(os.getenv("WEB_THREADS", "8"))
+# gthread: max concurrent client connections (incl. idle keep-alives) per worker
+worker_connections = int(os.getenv("WEB_WORKER_CONNECTIONS", "1000"))
 
 # Worker class & timeouts
 worker_class = "gthread"
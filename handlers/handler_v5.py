@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
+
+from ai_modes.contracts import EMPTY, SEARCH_INTENTS
 
 
 class MessageHandlerV5:
@@ -22,6 +25,16 @@ class MessageHandlerV5:
         self.rewriter = deps.rewriter
         self.overrides = deps.overrides
 
+        # Policy/geo/FAQ stores load their JSON once at construction, so
+        # lookups are pure per postcode/utterance; postcodes and FAQ questions
+        # repeat heavily, so memoize them for the handler's lifetime. Cached
+        # values are shared across requests: the rule dict is copied out (see
+        # _delivery_rule) and FAQ matches are cached as tuples.
+        self._delivery_rule_cached = lru_cache(maxsize=4096)(self.policy.delivery_rule_for)
+        self._delivery_summary = lru_cache(maxsize=4096)(self.policy.delivery_summary)
+        self._nearest = lru_cache(maxsize=4096)(self.geo.nearest_for_postcode)
+        self._faq_match = lru_cache(maxsize=2048)(self._faq_best)
+
     # ------------------------------------------------------------------
     # Public entrypoint called by master MessageHandler
     # ------------------------------------------------------------------
@@ -39,7 +52,8 @@ class MessageHandlerV5:
         route = self.router.route(user_text, route_ctx)
 
         # 2) Handle clarifiers with anti-loop logic for product queries
-        intent = (route.get("intent") or "unknown").strip() or "unknown"
+        route_intent = route.get("intent")
+        intent = (route_intent or "unknown").strip() or "unknown"
 
         if route.get("needs_clarification"):
             # For product/browse we try to use the user_text as query to avoid loops
@@ -70,7 +84,7 @@ class MessageHandlerV5:
         return {
             "reply": final,
             "mode": "v5",
-            "intent": route.get("intent"),
+            "intent": route_intent,
             "entities": route.get("entities") or {},
             "facts": facts,
         }
@@ -105,27 +119,27 @@ class MessageHandlerV5:
         V5 fact retrieval – no AI, just direct service calls.
         """
         intent = route.get("intent")
-        ent = route.get("entities", {}) or {}
+        ent = route.get("entities") or EMPTY
         facts: Dict[str, Any] = {}
 
         # Delivery check
         if intent in {"check_delivery", "ask_postcode"} or ("postcode" in ent):
             pc = ent.get("postcode") or sess.get("postcode")
             if pc:
-                rule = self.policy.delivery_rule_for(pc)
+                rule = self._delivery_rule(pc)
                 facts["delivery"] = {
                     "postcode": pc,
                     "rule": rule,
-                    "summary": self.policy.delivery_summary(pc),
+                    "summary": self._delivery_summary(pc),
                 }
-                nb = self.geo.nearest_for_postcode(pc)
+                nb = self._nearest(pc)
                 if nb:
                     facts["branch"] = {"nearest": nb}
 
         # Product search
         if intent in {"search_product", "browse_category"}:
             query = ent.get("query") or ent.get("category")
-            tags = ent.get("tags") or []
+            tags = ent.get("tags") or ()
             if query or tags:
                 items = self.catalog.search(text=query, tags=tags, limit=6)
                 facts["items"] = items
@@ -141,15 +155,15 @@ class MessageHandlerV5:
 
         # FAQ fallback
         if intent in {"faq", "unknown"}:
-            hints = ent.get("tags") or []
+            hints = ent.get("tags") or ()
             utterance = route.get("utterance") or route.get("text") or user_text
-            m = self.faq.best_match(utterance, hint_tags=hints, top_k=1)
+            m = self._faq_match(utterance, tuple(hints))
             if m:
                 placeholders: Dict[str, Any] = {}
                 if sess.get("postcode"):
                     placeholders["postcode"] = sess["postcode"]
                     placeholders["delivery_summary"] = (
-                        self.policy.delivery_summary(sess["postcode"]) or ""
+                        self._delivery_summary(sess["postcode"]) or ""
                     )
                 if sess.get("nearest_branch_id") and facts.get("branch", {}).get(
                     "nearest"
@@ -165,6 +179,54 @@ class MessageHandlerV5:
 
         return facts
 
+    def _delivery_rule(self, pc: str) -> Optional[Dict[str, Any]]:
+        # a fresh dict per request, as the uncached store returns: it goes
+        # into facts, sessions and CRM, where callers may mutate it
+        rule = self._delivery_rule_cached(pc)
+        return dict(rule) if rule is not None else None
+
+    def _faq_best(self, utterance: str, hints: Tuple[str, ...]) -> Tuple[Dict[str, Any], ...]:
+        # hints arrive as a tuple so the lru_cache wrapper can hash them
+        return tuple(self.faq.best_match(utterance, hint_tags=list(hints), top_k=1))
+
+    # Per-intent composers (plain functions in the class body, called with
+    # self): (self, facts) -> draft, or None when the intent's fact is missing.
+    def _compose_delivery(self, facts: Dict[str, Any]) -> Optional[str]:
+        d = facts.get("delivery")
+        if not d:
+            return None
+        if d["rule"]:
+            return f"Yes, we deliver to {d['postcode']}. {d['summary']}."
+        return f"We currently don’t deliver to {d['postcode']}."
+
+    def _compose_search(self, facts: Dict[str, Any]) -> Optional[str]:
+        items = facts.get("items")
+        if not items:
+            return None
+        # skip nameless items rather than joining "" and stripping separators
+        names = ", ".join(
+            [n for i in items[:3] if (n := i.get("name") or i.get("_norm_name"))]
+        )
+        if names:
+            return f"Top picks: {names}. Want prices or more options?"
+        return "I couldn’t find matching items."
+
+    def _compose_price(self, facts: Dict[str, Any]) -> Optional[str]:
+        p = facts.get("price")
+        if not p:
+            return None
+        if p["price"] is not None:
+            stock = "in stock" if p.get("in_stock") else "out of stock"
+            return f"{p['sku']} is £{p['price']:.2f} and {stock}."
+        return f"I couldn’t find a price for {p['sku']}."
+
+    _COMPOSERS: ClassVar[Dict[str, Callable[..., Optional[str]]]] = {
+        "check_delivery": _compose_delivery,
+        "ask_postcode": _compose_delivery,
+        **dict.fromkeys(SEARCH_INTENTS, _compose_search),
+        "price_check": _compose_price,
+    }
+
     def _compose_draft(
         self,
         route: Dict[str, Any],
@@ -174,33 +236,12 @@ class MessageHandlerV5:
         Deterministic text composition based purely on facts.
         This is the same logic your old handler used, lifted into V5.
         """
-        intent = route.get("intent")
-        ent = route.get("entities", {}) or {}
-
-        # Delivery
-        if intent in {"check_delivery", "ask_postcode"} and facts.get("delivery"):
-            d = facts["delivery"]
-            if d["rule"]:
-                return f"Yes, we deliver to {d['postcode']}. {d['summary']}."
-            return f"We currently don’t deliver to {d['postcode']}."
-
-        # Product search / browse
-        if intent in {"search_product", "browse_category"} and facts.get("items"):
-            items = facts["items"]
-            names = ", ".join(
-                i.get("name") or i.get("_norm_name", "") for i in items[:3]
-            ).strip(", ")
-            if names:
-                return f"Top picks: {names}. Want prices or more options?"
-            return "I couldn’t find matching items."
-
-        # Price check
-        if intent == "price_check" and facts.get("price"):
-            p = facts["price"]
-            if p["price"] is not None:
-                stock = "in stock" if p.get("in_stock") else "out of stock"
-                return f"{p['sku']} is £{p['price']:.2f} and {stock}."
-            return f"I couldn’t find a price for {p['sku']}."
+        intent = route.get("intent") or ""
+        composer = self._COMPOSERS.get(intent)
+        if composer is not None:
+            draft = composer(self, facts)
+            if draft is not None:
+                return draft
 
         # FAQ
         if facts.get("faq"):
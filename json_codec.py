@@ -0,0 +1,47 @@
+"""
+Shared JSON codec (connector bodies, storage reads, event logs, LLM payloads).
+
+Uses orjson when installed (C encoder/decoder, works on bytes directly) and
+falls back to stdlib json otherwise. Output is compact UTF-8 either way.
+
+Also holds EMPTY, the shared read-only empty object for payload walking.
+
+Stdlib only, and no imports from the app's packages, so any layer can use it.
+"""
+
+from __future__ import annotations
+import json
+from types import MappingProxyType
+from typing import Any, Mapping, Union
+
+try:
+    # Optional fast codec; stdlib json is used when it isn't installed
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+# Read-only stand-in for a missing nested object when walking decoded payloads
+# (`obj.get("metadata") or EMPTY`): never allocates, can't be mutated by accident.
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # e.g. non-str dict keys or >64-bit ints; stdlib copes
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str (no separate decode pass needed)."""
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
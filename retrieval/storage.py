@@ -3,6 +3,8 @@ Versioned JSON storage for tenant (business) data.
 
 Features
 - Read/write JSON under business/{TENANT}/*
+  * reads parse with orjson when installed (stdlib json otherwise) and reuse
+    the file bytes until its mtime/size/inode changes
 - Atomic writes via temp files + os.replace
 - JSON Schema validation (schemas/*.schema.json) when provided
 - Daily snapshots under business/versions/YYYY-MM-DD/{TENANT}/
@@ -25,9 +27,12 @@ import shutil
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import json_codec as codec
+
 try:
     # jsonschema is pinned in requirements.txt
     import jsonschema  # type: ignore
@@ -70,9 +75,18 @@ def _atomic_write_json(path: Path, data: Any) -> None:
     _atomic_write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
 
 
+@lru_cache(maxsize=64)
+def _read_raw(path: str, mtime_ns: int, size: int, ino: int) -> bytes:
+    # Keyed on the file's stat, so an edit (or an atomic os.replace) misses.
+    # Bytes are immutable: every caller still parses its own fresh objects.
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def _read_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    st = os.stat(path)
+    raw = _read_raw(str(path), st.st_mtime_ns, st.st_size, st.st_ino)
+    return codec.loads(raw)
 
 
 @dataclass(frozen=True)
@@ -32,9 +32,9 @@ def export_csv_route():
     output = io.StringIO()
     if rows:
         header = sorted({k for r in rows for k in r.keys()})
-        w = csv.DictWriter(output, fieldnames=header, extrasaction="ignore")
+        # DictWriter already fills missing keys with restval; pass rows through as-is
+        w = csv.DictWriter(output, fieldnames=header, restval="", extrasaction="ignore")
         w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in header})
+        w.writerows(rows)
 
     return Response(output.getvalue(), mimetype="text/csv")
@@ -9,7 +9,8 @@ from twilio.twiml.messaging_response import MessagingResponse
 
 from routes import get_container
 from service.security import verify_webhook_signature
-from connectors.whatsapp import parse_inbound, send_reply
+import json_codec as codec
+from connectors.whatsapp import parse_inbound, send_reply_async
 
 logger = logging.getLogger("WA.Webhook")
 
@@ -149,7 +150,11 @@ def webhook_receive():
     #                     CLOUD API PATH (JSON)
     # ------------------------------------------------------------------
     try:
-        payload = request.get_json(force=True, silent=True) or {}
+        # Parse the raw body directly (orjson when installed); bad JSON -> {}
+        try:
+            payload = codec.loads(request.get_data() or b"{}") or {}
+        except ValueError:
+            payload = {}
         logger.debug("WA WEBHOOK JSON payload: %s", str(payload)[:2000])
     except Exception as exc:
         logger.exception("WA WEBHOOK: invalid JSON payload: %s", exc)
@@ -217,7 +222,7 @@ def webhook_receive():
 
             if reply:
                 try:
-                    send_reply(ev, reply, settings=c.settings)
+                    send_reply_async(ev, reply, settings=c.settings)
                 except Exception as send_exc:
                     logger.exception(
                         "WA WEBHOOK: send_reply failed",
@@ -13,11 +13,15 @@ Design:
 """
 
 from __future__ import annotations
+import heapq
 import json
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from analytics.metrics import StreamingKpiAggregator
+from analytics.schema import validate_event
 
 try:
     # Optional import (adapter is present in your repo)
@@ -45,6 +49,10 @@ class AnalyticsService:
     sheets: Optional[Any] = None  # SheetsClient-like
     # in-proc store: tenant -> stats
     _stats: Dict[str, _TenantStats] = field(default_factory=dict)
+    # tenant -> running compute_kpis state, fed by log_event
+    _kpis: Dict[str, StreamingKpiAggregator] = field(default_factory=dict)
+    # request path -> [count, total_ms, max_ms], fed by the timing middleware
+    _timings: Dict[str, List[int]] = field(default_factory=dict)
     _lock: threading.Lock = field(default_factory=threading.Lock)
 
     # ------------- ingest -------------
@@ -63,21 +71,28 @@ class AnalyticsService:
         """
         if not tenant:
             return
+        # Coerce the contract fields once for the aggregator and counters; the
+        # Sheets mirror gets the caller's event as-is
+        valid = validate_event({"timestamp": _now_iso(), **event, "tenant": tenant})
         t = int(time.time())
         minute = t // 60
 
         with self._lock:
+            agg = self._kpis.get(tenant)
+            if agg is None:
+                agg = self._kpis[tenant] = StreamingKpiAggregator()
+            agg.add(valid)
             st = self._stats.setdefault(tenant, _TenantStats())
             # common totals
             st.totals["events"] = st.totals.get("events", 0) + 1
-            if event.get("type") == "chat_turn":
+            if valid.get("type") == "chat_turn":
                 st.totals["chat_turns"] = st.totals.get("chat_turns", 0) + 1
                 st.bucket_chat[minute] = st.bucket_chat.get(minute, 0) + 1
-                intent = event.get("intent") or "unknown"
+                intent = valid["intent"] or "unknown"
                 st.intents[intent] = st.intents.get(intent, 0) + 1
-            elif event.get("type") == "conversion":
+            elif valid.get("type") == "conversion":
                 st.totals["conversions"] = st.totals.get("conversions", 0) + 1
-            elif event.get("type") == "error":
+            elif valid.get("type") == "error":
                 st.errors += 1
                 st.totals["errors"] = st.totals.get("errors", 0) + 1
 
@@ -96,6 +111,27 @@ class AnalyticsService:
             st = self._stats.setdefault(tenant, _TenantStats())
             st.totals[key] = st.totals.get(key, 0) + int(n)
 
+    def record_timings_bulk(self, samples: Iterable[Tuple[str, int]]) -> None:
+        """Fold a batch of (path, ms) request timings into per-path counters."""
+        with self._lock:
+            timings = self._timings
+            for path, ms in samples:
+                t = timings.get(path)
+                if t is None:
+                    timings[path] = [1, ms, ms]
+                else:
+                    t[0] += 1
+                    t[1] += ms
+                    if ms > t[2]:
+                        t[2] = ms
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                p: {"count": c, "avg_ms": round(total / c, 2), "max_ms": mx}
+                for p, (c, total, mx) in self._timings.items()
+            }
+
     # ------------- charts / summaries -------------
 
     def summary(self, tenant: str, period_minutes: int = 60 * 24) -> Dict[str, Any]:
@@ -114,6 +150,12 @@ class AnalyticsService:
                 "top_items": self._top_k(st.items, k=10),
             }
 
+    def kpis(self, tenant: str) -> Dict[str, Any]:
+        """compute_kpis-shaped KPIs over every event logged for tenant (O(1) to read)."""
+        with self._lock:
+            agg = self._kpis.get(tenant) or StreamingKpiAggregator()
+            return agg.snapshot()
+
     def chart_timeseries(self, tenant: str, period_minutes: int = 60 * 24) -> Dict[str, Any]:
         now_min = int(time.time() // 60)
         start_min = now_min - period_minutes
@@ -130,4 +172,5 @@ class AnalyticsService:
 
     @staticmethod
     def _top_k(d: Dict[str, int], k: int = 5) -> List[Dict[str, Any]]:
-        return [{"key": k0, "count": d[k0]} for k0 in sorted(d, key=d.get, reverse=True)[:k]]
+        # nlargest == sorted(..., reverse=True)[:k] (ties included) without sorting all keys
+        return [{"key": k0, "count": d[k0]} for k0 in heapq.nlargest(k, d, key=d.__getitem__)]
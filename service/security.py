@@ -21,6 +21,7 @@ from __future__ import annotations
 
 import hmac
 import hashlib
+from functools import lru_cache
 from typing import Optional
 
 import bcrypt
@@ -60,6 +61,12 @@ def check_password(plain: str, hashed: str) -> bool:
 # ------------- Webhook signature verification (WhatsApp / Meta) -------------
 
 
+@lru_cache(maxsize=4)
+def _webhook_hmac(app_secret: str) -> "hmac.HMAC":
+    """Keyed HMAC-SHA256 with no data; callers .copy() it to skip re-keying."""
+    return hmac.new(app_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def verify_webhook_signature(request: Request, app_secret: Optional[str]) -> bool:
     """
     Verify Meta / WhatsApp webhook signature.
@@ -83,18 +90,18 @@ def verify_webhook_signature(request: Request, app_secret: Optional[str]) -> boo
         # Missing or malformed signature
         return False
 
-    received_sig = header[len(prefix) :].strip()
-    if not received_sig:
+    try:
+        received = bytes.fromhex(header[len(prefix) :].strip())
+    except ValueError:
+        return False
+    if not received:
         return False
 
     # Raw body; cache=True so Flask doesn't consume the stream
     body = request.get_data(cache=True) or b""
 
-    computed = hmac.new(
-        app_secret.encode("utf-8"),
-        body,
-        hashlib.sha256,
-    ).hexdigest()
+    mac = _webhook_hmac(app_secret).copy()
+    mac.update(body)
 
-    # Use constant-time comparison
-    return hmac.compare_digest(received_sig, computed)
+    # Use constant-time comparison (raw digests: half the bytes of hex)
+    return hmac.compare_digest(received, mac.digest())
@@ -0,0 +1,212 @@
+"""
+Analytics tests: exporters (CSV / Sheets) on flat event dicts.
+
+Pure-library tests — no Flask app or connectors involved.
+"""
+
+from __future__ import annotations
+import csv
+import json
+import random
+
+from analytics.exporters import export_csv, export_to_sheets  # type: ignore
+from analytics.metrics import (  # type: ignore
+    EventColumns,
+    StreamingKpiAggregator,
+    compute_kpis,
+    compute_rollups,
+    summarize_tenant,
+)
+from analytics.schema import validate_event  # type: ignore
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_export_csv_unions_header_and_fills_missing(tmp_path):
+    rows = [{"b": 2, "a": 1}, {"b": 3, "c": "x,y"}]
+    out = export_csv(rows, str(tmp_path / "events.csv"))
+    assert read_csv(out) == [["a", "b", "c"], ["1", "2", ""], ["", "3", "x,y"]]
+
+
+def test_export_csv_streams_with_fieldnames(tmp_path):
+    rows = ({"a": i, "extra": "x"} for i in range(3))  # one-shot iterator
+    out = export_csv(rows, str(tmp_path / "events.csv"), fieldnames=["a", "b"])
+    assert read_csv(out) == [["a", "b"], ["0", ""], ["1", ""], ["2", ""]]
+
+
+def test_export_to_sheets_appends_in_batches():
+    calls = []
+
+    class FakeSheets:
+        def append_rows(self, sheet_name, rows):
+            calls.append((sheet_name, rows))
+            return len(rows)
+
+    rows = [{"a": i} for i in range(5)]
+    res = export_to_sheets(rows, FakeSheets(), sheet_name="ev", batch_size=2)
+    assert res == {"sheet": "ev", "written": 6}
+    assert [len(r) for _, r in calls] == [1, 2, 2, 1]
+    assert calls[0][1] == [["a"]]
+
+
+def test_export_csv_pyarrow_engine_matches_stdlib(tmp_path):
+    rows = [{"b": 2, "a": 1}, {"b": 3, "c": 'x,y "q"'}, {"a": None, "c": 1.5}]
+    std = export_csv(rows, str(tmp_path / "std.csv"))
+    arrow = export_csv(rows, str(tmp_path / "arrow.csv"), engine="pyarrow")
+    # pyarrow quotes every string cell; parsed content must still be identical
+    assert read_csv(arrow) == read_csv(std)
+
+
+def test_export_to_sheets_header_unions_mixed_schemas():
+    class FakeSheets:
+        def __init__(self):
+            self.rows = []
+
+        def append_rows(self, sheet_name, rows):
+            self.rows.extend(rows)
+            return len(rows)
+
+    sheets = FakeSheets()
+    export_to_sheets([{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"c": 5}], sheets)
+    assert sheets.rows == [["a", "b", "c"], [1, 2, ""], [3, 4, ""], ["", "", 5]]
+
+
+def sample_events():
+    return [
+        {"timestamp": "2025-11-09T12:00:00Z", "tenant": "EXAMPLE", "channel": "web",
+         "intent": "faq.hours", "resolved": True, "deflected": True,
+         "offer_shown": True, "offer_clicked": True, "latency_ms": 100},
+        {"timestamp": "2025-11-10T08:30:00Z", "tenant": "EXAMPLE", "channel": "wa",
+         "intent": "catalog.search", "resolved": False, "deflected": False,
+         "offer_shown": True, "offer_clicked": False, "latency_ms": 300},
+        {"timestamp": "2025-11-10T09:00:00Z", "tenant": "OTHER", "channel": "web",
+         "intent": "faq.hours", "resolved": True, "deflected": True, "latency_ms": 200},
+    ]
+
+
+def test_compute_kpis_single_pass_values():
+    k = compute_kpis(sample_events())
+    assert k["total"] == 3
+    assert k["deflection_rate"] == round(2 / 3, 4)
+    assert k["offer_ctr"] == 0.5
+    assert k["avg_latency_ms"] == 200.0
+    assert k["p50_latency_ms"] == 200.0
+    assert k["p50_latency_ms_exact"] is True
+    assert k["top_intents"][0] == ("faq.hours", 2)
+    assert k["time_range"]["days"] == 1
+    assert compute_kpis([])["total"] == 0
+    gaps = compute_kpis([{"latency_ms": 100}, {"latency_ms": None}, {}, {"latency_ms": 400}])
+    assert (gaps["avg_latency_ms"], gaps["p50_latency_ms"]) == (250.0, 250.0)
+
+
+def test_compute_kpis_large_batch_estimates_p50():
+    events = [{"latency_ms": (i * 7919) % 20_001} for i in range(20_001)]
+    k = compute_kpis(events)
+    assert k["p50_latency_ms_exact"] is False
+    assert abs(k["p50_latency_ms"] - 10_000) < 100
+
+
+def test_streaming_aggregator_matches_batch_kpis():
+    agg = StreamingKpiAggregator()
+    assert agg.snapshot() == compute_kpis([])
+    events = sample_events() + [{"timestamp": "2025-11-08T07:00:00+00:00", "latency_ms": None}]
+    for e in events:
+        agg.add(e)
+    assert agg.snapshot() == compute_kpis(events)
+
+    big = [{"latency_ms": (i * 7919) % 20_001} for i in range(20_001)]
+    agg = StreamingKpiAggregator()
+    agg.update(big)
+    assert agg.snapshot() == compute_kpis(big)
+
+
+def test_fractional_latencies_match_float64_and_streaming():
+    rng = random.Random(7)
+    for _ in range(200):
+        events = [{"latency_ms": round(rng.uniform(0, 20_000), 3)} for _ in range(rng.randint(1, 40))]
+        k = compute_kpis(events)
+        lats = [e["latency_ms"] for e in events]
+        assert k["avg_latency_ms"] == round(sum(lats) / len(lats), 2)
+        agg = StreamingKpiAggregator()
+        agg.update(events)
+        assert agg.snapshot() == k
+
+
+def test_compute_kpis_time_range_with_mixed_timestamp_formats():
+    events = [
+        {"timestamp": "2025-11-09T23:30:00+00:00"},
+        {"timestamp": "2025-11-09T22:00:00Z"},
+        {"timestamp": "2025-11-11T01:00:00.250000+00:00"},
+    ]
+    tr = compute_kpis(events)["time_range"]
+    assert tr["start"].startswith("2025-11-09T22:00:00")
+    assert tr["end"].startswith("2025-11-11T01:00:00.25")
+
+
+def test_compute_rollups_groups_by_day_and_channel():
+    r = compute_rollups(sample_events(), by="day")
+    assert list(r["by_time"]) == ["2025-11-09", "2025-11-10"]
+    assert r["by_time"]["2025-11-10"]["total"] == 2
+    assert r["by_channel"]["web"]["total"] == 2
+    assert r["by_channel"]["wa"]["p50_latency_ms"] == 300.0
+
+
+def test_compute_rollups_hour_keys_across_timestamp_layouts():
+    stamps = ["2025-11-09T23:30:00-05:00", "2025-11-09T23:59:59Z", "2025-11-10T01:00:00+00:00",
+              "2025-11-10 01:15:00.123Z", None]
+    r = compute_rollups([{"timestamp": t, "channel": "web"} for t in stamps], by="hour")
+    assert {k: v["total"] for k, v in r["by_time"].items()} == {
+        "2025-11-09 23:00": 2, "2025-11-10 01:00": 2, "unknown": 1,
+    }
+    weeks = compute_rollups([{"timestamp": t} for t in stamps[:4]], by="week")
+    assert list(weeks["by_time"]) == ["2025-W45", "2025-W46"]
+
+
+def test_summarize_tenant_filters_before_kpis_and_rollups():
+    s = summarize_tenant(sample_events(), "EXAMPLE")
+    assert s["kpis"]["total"] == 2
+    assert sum(b["total"] for b in s["rollups"]["by_time"].values()) == 2
+    assert s["generated_at"].endswith("Z")
+
+
+def test_summarize_tenant_caches_by_content():
+    events = sample_events()
+    first = summarize_tenant(events, "EXAMPLE")
+    first["kpis"]["total"] = -1  # callers own their copy; the cache is untouched
+    again = summarize_tenant(sample_events(), "EXAMPLE")
+    assert again is not first and again["kpis"]["total"] == 2
+    assert again["generated_at"] == first["generated_at"]
+
+    events[0]["latency_ms"] = 900
+    changed = summarize_tenant(events, "EXAMPLE")
+    assert changed["kpis"]["avg_latency_ms"] == 600.0
+
+
+def test_validate_event_coerces_contract_fields():
+    e = validate_event({"intent": 7, "channel": None, "latency_ms": "n/a", "timestamp": ""})
+    assert e["intent"] == "7" and e["channel"] == "unknown"
+    assert e["latency_ms"] is None and e["timestamp"] is None
+
+
+def test_event_columns_accepted_everywhere(tmp_path):
+    log = tmp_path / "events.jsonl"
+    log.write_text("\n".join(json.dumps(e) for e in sample_events()) + "\n\n", encoding="utf-8")
+    cols = EventColumns.from_jsonl(str(log))
+    assert len(cols) == 3
+    assert compute_kpis(cols) == compute_kpis(sample_events())
+    assert summarize_tenant(cols, "OTHER")["kpis"]["total"] == 1
+
+
+def test_sheets_mirror_gets_the_callers_event():
+    from service.analytics_service import AnalyticsService  # type: ignore
+
+    mirrored = []
+    sheets = type("Sheets", (), {"append_event": lambda self, t, e: mirrored.append(e)})()
+    svc = AnalyticsService(sheets=sheets)
+    svc.log_event("T1", {"type": "chat_turn", "intent": 7})
+    assert svc.kpis("T1")["top_intents"] == [("7", 1)]
+    (row,) = mirrored
+    assert row.keys() == {"ts", "type", "intent"} and row["intent"] == 7
@@ -0,0 +1,36 @@
+"""
+Billing connector tests:
+- webhook parsing normalizes well-formed Stripe / Paddle events
+- a malformed nested object raises instead of passing as an empty event
+"""
+
+from __future__ import annotations
+import json
+
+import pytest
+
+from connectors.billing import BillingClient
+
+
+def _parse(provider, payload):
+    return BillingClient(provider=provider, api_key="k", api_base="").parse_webhook({}, json.dumps(payload).encode())
+
+
+def test_stripe_and_paddle_events_normalize():
+    evt = _parse("stripe", {"type": "invoice.paid", "data": {"object": {
+        "metadata": {"tenant": "T1"}, "customer_details": {"email": "a@b.c"}}}})
+    assert (evt["tenant"], evt["type"], evt["customer_email"]) == ("T1", "invoice.paid", "a@b.c")
+
+    evt = _parse("paddle", {"event_type": "subscription.created", "data": {
+        "metadata": {"business_key": "T2"}, "customer": None, "email": "x@y.z"}})
+    assert (evt["tenant"], evt["customer_email"]) == ("T2", "x@y.z")
+
+
+@pytest.mark.parametrize("provider, payload", [
+    ("stripe", {"type": "invoice.paid", "data": None}),
+    ("stripe", {"type": "invoice.paid", "data": {"object": []}}),
+    ("paddle", {"event_type": "subscription.created", "data": ["not", "a", "dict"]}),
+])
+def test_malformed_nested_objects_raise(provider, payload):
+    with pytest.raises(AttributeError):
+        _parse(provider, payload)
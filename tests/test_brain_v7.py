@@ -0,0 +1,32 @@
+"""
+BrainV7 plan parsing tests:
+- empty-string optional fields from the model are kept, not replaced by None
+- missing fields fall back to session values / defaults
+"""
+
+from __future__ import annotations
+import json
+
+from brain_v7 import BrainV7
+
+
+def _parse(data, session=None):
+    brain = object.__new__(BrainV7)  # parsing doesn't touch the OpenAI client
+    return brain._safe_parse_plan(json.dumps(data), session or {})
+
+
+def test_empty_optional_fields_are_kept():
+    plan = _parse({"intent": "search_product", "category": "", "product_name": "", "handoff_channel": ""})
+    assert plan["category"] == ""
+    assert plan["product_name"] == ""
+    assert plan["handoff_channel"] == ""
+
+
+def test_missing_fields_use_session_and_defaults():
+    plan = _parse({"intent": " faq ", "postcode": ""}, {"postcode": "E6 1AA", "last_sku": "SKU1"})
+    assert plan["intent"] == "faq"
+    assert plan["action"] == "DO_NOTHING"
+    assert plan["postcode"] == "E6 1AA"
+    assert plan["sku"] == "SKU1"
+    assert plan["category"] is None
+    assert plan["meta"] == {"is_greeting": False, "is_goodbye": False}
@@ -0,0 +1,24 @@
+"""
+Container tests:
+- the per-tenant store registry is reused until the tenant's files change
+"""
+
+from __future__ import annotations
+import json
+
+from app import container
+from retrieval.storage import Storage
+
+
+def test_tenant_stores_rebuilt_after_file_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(Storage, "tenant_dir", lambda self, tenant=None: tmp_path)
+    monkeypatch.setattr(container, "_STORES", {})
+    (tmp_path / "faq.json").write_text("[]", encoding="utf-8")
+
+    first = container._TenantStores.get("T1")
+    assert container._TenantStores.get("T1") is first
+
+    (tmp_path / "faq.json").write_text(json.dumps([{"q": "hours?", "a": "9-5"}]), encoding="utf-8")
+    second = container._TenantStores.get("T1")
+    assert second is not first
+    assert container._TenantStores.get("T1") is second
@@ -0,0 +1,89 @@
+"""
+Emailer SMTP pool tests (fake smtplib.SMTP, no network):
+- a warm session is reused; a stale one is closed and the send retried
+- sessions idle past _SMTP_IDLE_S are evicted instead of reused
+- a session that doesn't fit back in a full pool is closed
+"""
+
+from __future__ import annotations
+import smtplib
+import time
+
+import pytest
+
+from connectors import emailer
+from connectors.emailer import Emailer
+
+
+class _FakeSMTP:
+    instances: list = []
+
+    def __init__(self, host, port, timeout=None):
+        self.host = host
+        self.sent = []
+        self.closed = False
+        self.stale = False
+        self.on_send = None
+        _FakeSMTP.instances.append(self)
+
+    def ehlo(self):
+        pass
+
+    def send_message(self, msg):
+        if self.stale:
+            raise smtplib.SMTPServerDisconnected("idle timeout")
+        if self.on_send:
+            self.on_send()
+        self.sent.append(msg["To"])
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+@pytest.fixture()
+def mail(monkeypatch):
+    _FakeSMTP.instances = []
+    monkeypatch.setattr(emailer.smtplib, "SMTP", _FakeSMTP)
+    return Emailer(backend="smtp", smtp_host="mx.test", smtp_tls=False)
+
+
+def _send(mail, to="a@example.com"):
+    return mail.send(to, subject="s", text="t")
+
+
+def test_warm_session_reused_and_stale_one_replaced(mail):
+    assert _send(mail) and _send(mail, "b@example.com")
+    (first,) = _FakeSMTP.instances
+    assert first.sent == ["a@example.com", "b@example.com"] and not first.closed
+
+    first.stale = True  # server dropped the pooled session
+    assert _send(mail, "c@example.com")
+    second = _FakeSMTP.instances[1]
+    assert first.closed and second.sent == ["c@example.com"]
+    assert mail._smtp_pool.get_nowait()[0] is second
+
+
+def test_idle_session_evicted(mail, monkeypatch):
+    _send(mail)
+    monkeypatch.setattr(emailer, "_SMTP_IDLE_S", -1.0)
+    _send(mail)
+    first, second = _FakeSMTP.instances
+    assert first.closed and not second.closed
+
+
+def test_session_closed_when_pool_is_full(mail):
+    _send(mail)
+    (server,) = _FakeSMTP.instances
+
+    def fill_pool():  # other sends return their sessions meanwhile
+        for _ in range(emailer._SMTP_POOL_SIZE):
+            mail._smtp_pool.put_nowait((_FakeSMTP("mx.test", 587), time.monotonic()))
+
+    server.on_send = fill_pool
+    assert _send(mail)
+    assert server.closed
+    assert mail._smtp_pool.qsize() == emailer._SMTP_POOL_SIZE
+    mail.close()
+    assert all(s.closed for s in _FakeSMTP.instances)
@@ -0,0 +1,36 @@
+"""
+V5 handler tests:
+- memoized delivery lookups hand each request its own rule dict
+"""
+
+from __future__ import annotations
+from types import SimpleNamespace
+
+from handlers.handler_v5 import MessageHandlerV5
+
+
+class _Policy:
+    def __init__(self):
+        self.calls = 0
+
+    def delivery_rule_for(self, postcode):
+        self.calls += 1
+        return {"fee": 2.5, "source": "prefix"}
+
+    def delivery_summary(self, postcode):
+        return "£2.50 fee"
+
+
+def test_cached_delivery_rule_is_not_shared_between_requests():
+    policy = _Policy()
+    deps = SimpleNamespace(router=None, catalog=None, policy=policy, faq=None, rewriter=None,
+                           overrides=None, geo=SimpleNamespace(nearest_for_postcode=lambda pc: None))
+    h = MessageHandlerV5(deps)
+    route = {"intent": "check_delivery", "entities": {"postcode": "E1 6AN"}}
+
+    first = h._gather_facts(route, {}, "do you deliver?")
+    first["delivery"]["rule"]["fee"] = 0
+    second = h._gather_facts(route, {}, "do you deliver?")
+
+    assert second["delivery"]["rule"] == {"fee": 2.5, "source": "prefix"}
+    assert policy.calls == 1
@@ -0,0 +1,75 @@
+"""
+Logging pipeline tests:
+- a forked child (gunicorn preload_app) writes its own records to the log files
+- ... and echoes them to the console
+"""
+
+from __future__ import annotations
+import logging
+import os
+import sys
+
+import pytest
+
+from app import logging_setup
+from app.config import load_settings
+
+
+def _run_in_child(fn) -> int:
+    """Fork, run fn() in the child, return the child's pid once it exits cleanly."""
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            fn()
+            code = 0
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    return pid
+
+
+@pytest.fixture()
+def pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # the console handler binds sys.stderr when configured
+    console = open(tmp_path / "console.txt", "w", encoding="utf-8")
+    monkeypatch.setattr(sys, "stderr", console)
+    logging_setup.configure_logging(load_settings())
+    yield logging_setup._PIPELINE
+    logging_setup._PIPELINE.stop()
+    logging.getLogger().removeHandler(logging_setup._PIPELINE.handler)
+    console.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_writes_file_logs(pipeline, tmp_path):
+    log = logging.getLogger("Runtime")
+    log.info("from parent")
+
+    def child():
+        log.info("from child %d", os.getpid())
+        logging_setup._PIPELINE.stop()
+
+    pid = _run_in_child(child)
+    pipeline.stop()
+
+    text = (tmp_path / "logs" / "chatbot.log").read_text("utf-8")
+    assert f"from child {pid}" in text
+    # the child drops the parent's buffered copies instead of rewriting them
+    assert text.count("from parent") == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_writes_console_logs(pipeline, tmp_path):
+    log = logging.getLogger("WA.Webhook")
+
+    def child():
+        log.info("console from child %d", os.getpid())
+        logging_setup._PIPELINE.stop()
+
+    pid = _run_in_child(child)
+    pipeline.stop()
+
+    assert f"console from child {pid}" in (tmp_path / "console.txt").read_text("utf-8")
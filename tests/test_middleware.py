@@ -0,0 +1,40 @@
+"""
+Middleware tests:
+- timing metrics: each app's samples drain into its own analytics service
+- one drainer thread per process, however many apps install it
+"""
+
+from __future__ import annotations
+import threading
+from types import SimpleNamespace
+
+from flask import Flask
+
+from app import middleware
+
+
+class _Analytics:
+    def __init__(self):
+        self.samples = []
+
+    def record_timings_bulk(self, samples):
+        self.samples.extend(samples)
+
+
+def _timed_app():
+    analytics = _Analytics()
+    app = Flask(__name__)
+    middleware.install_timing_metrics(app, SimpleNamespace(analytics=analytics))
+    app.add_url_rule("/ping", "ping", lambda: "ok")
+    return app, analytics
+
+
+def test_timing_drainer_shared_across_apps():
+    apps = [_timed_app() for _ in range(3)]
+    for app, _ in apps:
+        app.test_client().get("/ping")
+    middleware._drain_timings()
+
+    assert [[p for p, _ in a.samples] for _, a in apps] == [["/ping"]] * 3
+    names = [t.name for t in threading.enumerate()]
+    assert names.count("timing-flush") == 1
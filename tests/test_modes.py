@@ -95,3 +95,44 @@ def test_v5_v6_v7_parity_simple_faq():
     # None should introduce external claims
     for r in (r5, r6, r7):
         assert "guaranteed next-day worldwide" not in r.lower()
+
+
+def test_strategy_classes_resolve_lazily():
+    import ai_modes
+
+    assert set(ai_modes._LAZY) <= set(ai_modes.__all__)
+    assert ai_modes.AIV7Flagship.__module__ == "ai_modes.v7_flagship"
+    with pytest.raises(AttributeError):
+        ai_modes.NotAMode  # noqa: B018
+
+
+def test_safe_minimal_rewrite_fast_path_matches_normalization():
+    from ai_modes.contracts import safe_minimal_rewrite
+
+    clean = "Yes. All products are halal."
+    assert safe_minimal_rewrite(clean) is clean
+    assert safe_minimal_rewrite("Yes.\nAll\xa0products") == "Yes. All products"
+    assert safe_minimal_rewrite("  we deliver  ") == "We deliver"
+
+
+def test_factories_see_prompts_edited_in_place():
+    prompts = {"clarifiers": {"unknown": "old?"}}
+    assert make_v7(prompts=prompts).rewrite("", {"intent": "unknown"}) == "old?"
+    prompts["clarifiers"]["unknown"] = "new?"
+    assert make_v7(prompts=prompts).rewrite("", {"intent": "unknown"}) == "new?"
+
+
+def test_grounded_mode_defaults_cover_unhandled_intents():
+    from ai_modes.base import GroundedMode
+
+    class Bare(GroundedMode):
+        name = "bare"
+
+    mode = Bare()
+    mode._init_prompts(None)
+    ctx = {"intent": "order_status", **ctx_base()}
+    plan = mode.plan("where is my order?", ctx)
+    assert plan["tools"] == [] and plan["constraints"]["no_fabrication"] is True
+    assert mode.rewrite("", ctx) == "Could you clarify what you need?"
+    out = mode.rewrite("ignored", {**ctx, "facts": {"faq": {"answer": "Orders ship in 2 days."}}})
+    assert out.startswith("Orders ship in 2 days.")
@@ -134,3 +134,14 @@ def test_synonyms_merge_and_lookup(storage):
     ss.merge_suggestions(new_map)
     exp2 = ss.expand_terms(["braai"])
     assert "bbq" in " ".join(exp2).lower()
+
+
+def test_storage_read_json_sees_rewrites_and_returns_fresh_objects(tmp_path):
+    s = Storage("T", business_root=tmp_path, versions_root=tmp_path / "versions")
+    s.write_json(None, "faq.json", [{"q": "a"}], snapshot=False)
+    first = s.read_json(None, "faq.json")
+    first.append("mutated")
+    assert s.read_json(None, "faq.json") == [{"q": "a"}]
+
+    s.write_json(None, "faq.json", [{"q": "b"}], snapshot=False)
+    assert s.read_json(None, "faq.json") == [{"q": "b"}]
@@ -0,0 +1,43 @@
+"""
+Sheets connector tests:
+- an event that can't be JSON-encoded is dropped alone; the rest are sent
+- the background flusher survives a failing flush
+"""
+
+from __future__ import annotations
+import threading
+
+from connectors.sheets import SheetsClient
+
+
+def test_unserializable_event_is_dropped_alone():
+    sent = []
+    c = SheetsClient("http://sheets.test", "key", "sheet", flush_interval_s=60)
+    c._req = lambda url, payload: sent.append(payload["values"]) or True
+
+    c.append_event("t1", {"type": "bad", "ids": {1, 2}})
+    c.append_event("t1", {"type": "ok1"})
+    assert c.flush() is True
+    c.append_event("t1", {"type": "ok2"})
+    assert c.flush() is True
+    c.close()
+
+    assert [[row[2] for row in batch] for batch in sent] == [["ok1"], ["ok2"]]
+
+
+def test_flusher_survives_a_failing_flush():
+    c = SheetsClient("http://sheets.test", "key", "sheet", flush_interval_s=0.01)
+    calls = []
+    recovered = threading.Event()
+
+    def flaky_flush():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        recovered.set()
+        return True
+
+    c.flush = flaky_flush
+    c.append_event("t1", {"type": "ok"})  # starts the flusher
+    assert recovered.wait(2)
+    c.close()
@@ -0,0 +1,28 @@
+"""
+WhatsApp connector tests:
+- async replies to one recipient are sent in the order they were queued
+"""
+
+from __future__ import annotations
+import random
+import time
+
+from connectors import whatsapp
+
+
+def test_async_replies_keep_per_recipient_order(monkeypatch):
+    sent = []
+
+    def slow_send(event, reply, *, settings):
+        time.sleep(random.random() / 200)
+        sent.append((event["from"], reply))
+
+    monkeypatch.setattr(whatsapp, "send_reply", slow_send)
+    for i in range(20):
+        for wa_id in ("4471", "4472"):
+            whatsapp.send_reply_async({"from": wa_id, "source": "cloud"}, f"r{i}", settings=None)
+    for wa_id in ("4471", "4472"):
+        whatsapp._lane(wa_id).submit(lambda: None).result()  # lanes are FIFO
+
+    for wa_id in ("4471", "4472"):
+        assert [r for w, r in sent if w == wa_id] == [f"r{i}" for i in range(20)]